@@ -1,20 +1,44 @@
 import argparse
-import os, io, json
+import os, io, gc, re, sys, json, mmap, time, struct, shutil, fnmatch, hashlib
+import tarfile, zipfile
+import cProfile, tracemalloc
+import threading, multiprocessing
+from array import array
+from bisect import bisect_left
+from collections import ChainMap, OrderedDict, defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import accumulate
+from math import lcm
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from zlib import crc32
 import UnityPy
 from typing import TypeVar
 from UnityPy.classes import (
-    MonoBehaviour,
+    AnimationClip,
     GameObject,
     Transform,
     PPtr,
     Texture2D,
 )
-from UnityPy.enums import ClassIDType
+from UnityPy.enums import BuildTarget, ClassIDType, TextureFormat
+from UnityPy.export.Texture2DConverter import parse_image_data
+from UnityPy.environment import reSplit, simplify_name
 from UnityPy.files import ObjectReader
+from UnityPy.helpers.TypeTreeNode import TypeTreeNode
+import logging
 from logging import getLogger
 import coloredlogs
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 T = TypeVar("T")
 
 # from UnityPy.helpers import TypeTreeHelper
@@ -22,7 +46,8 @@ T = TypeVar("T")
 logger = getLogger("UnityPyLive2DExtractor")
 
 from UnityPyLive2DExtractor import __version__
-from UnityPyLive2DExtractor.generated import UTTCGen_AsInstance, UTTCGen_GetClass
+from UnityPyLive2DExtractor import uttcgen_runtime
+from UnityPyLive2DExtractor.uttcgen_runtime import UTTCGen_AsInstance, UTTCGen_GetClass
 from UnityPyLive2DExtractor.generated.Live2D.Cubism.Core import CubismModel
 from UnityPyLive2DExtractor.generated.Live2D.Cubism.Rendering import CubismRenderer
 from UnityPyLive2DExtractor.generated.Live2D.Cubism.Framework.Physics import (
@@ -35,8 +60,6 @@ from UnityPyLive2DExtractor.generated.Live2D.Cubism.Framework.Physics import (
     CubismPhysicsRig,
     CubismPhysicsController,
 )
-from sssekai.fmt.motion3 import to_motion3
-from sssekai.fmt.moc3 import read_moc3
 from sssekai.unity.AnimationClip import AnimationHelper
 
 
@@ -147,40 +170,274 @@ def __eq__(self: CubismRenderer, other: CubismRenderer):
     return self.__hash__() == other.__hash__()
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
 class ExtractorFlags:
     live2d_variant: str = "cubism"
+    texture_jobs: int = 4
+    all_anim: bool = False
+    object_cache: int = 4096
+    mmap: bool = True
+    write_jobs: int = 2
+    write_buffer: int = 64
+    fsync: str = "never"
+    json_compact: bool = False
+    json_encoder: str = "auto"
+    profile: bool = False
+    numpy_arrays: bool = False
+    texture_format: str = "png"
+    # --include/--exclude patterns, see model_matches
+    include: list = field(default_factory=list)
+    exclude: list = field(default_factory=list)
 
 
 FLAGS = ExtractorFlags()
+# MonoBehaviours that are fully decoded during discovery
+EXPORTED_CLASSES = {CubismModel.__fullname__}
 
 
-# XXX: Is monkey patching this into UnityPy a good idea?
-def read_from(reader: ObjectReader, **kwargs):
-    """Import generated classes by MonoBehavior script class type and read from reader"""
-    import importlib
+# Shared head of every MonoBehaviour typetree, up to and including m_Script
+# fmt: off
+MONOBEHAVIOUR_HEAD = TypeTreeNode.from_list([
+    {"m_Type": "MonoBehaviour", "m_Name": "Base", "m_Level": 0, "m_MetaFlag": 0},
+    {"m_Type": "PPtr<GameObject>", "m_Name": "m_GameObject", "m_Level": 1, "m_MetaFlag": 0},
+    {"m_Type": "int", "m_Name": "m_FileID", "m_Level": 2, "m_MetaFlag": 0},
+    {"m_Type": "SInt64", "m_Name": "m_PathID", "m_Level": 2, "m_MetaFlag": 0},
+    {"m_Type": "UInt8", "m_Name": "m_Enabled", "m_Level": 1, "m_MetaFlag": 16384},
+    {"m_Type": "PPtr<MonoScript>", "m_Name": "m_Script", "m_Level": 1, "m_MetaFlag": 0},
+    {"m_Type": "int", "m_Name": "m_FileID", "m_Level": 2, "m_MetaFlag": 0},
+    {"m_Type": "SInt64", "m_Name": "m_PathID", "m_Level": 2, "m_MetaFlag": 0},
+])
+# ...and that of serialized files older than version 14, where PathIDs are 32-bit
+MONOBEHAVIOUR_HEAD_32 = TypeTreeNode.from_list([
+    {"m_Type": "MonoBehaviour", "m_Name": "Base", "m_Level": 0, "m_MetaFlag": 0},
+    {"m_Type": "PPtr<GameObject>", "m_Name": "m_GameObject", "m_Level": 1, "m_MetaFlag": 0},
+    {"m_Type": "int", "m_Name": "m_FileID", "m_Level": 2, "m_MetaFlag": 0},
+    {"m_Type": "int", "m_Name": "m_PathID", "m_Level": 2, "m_MetaFlag": 0},
+    {"m_Type": "UInt8", "m_Name": "m_Enabled", "m_Level": 1, "m_MetaFlag": 16384},
+    {"m_Type": "PPtr<MonoScript>", "m_Name": "m_Script", "m_Level": 1, "m_MetaFlag": 0},
+    {"m_Type": "int", "m_Name": "m_FileID", "m_Level": 2, "m_MetaFlag": 0},
+    {"m_Type": "int", "m_Name": "m_PathID", "m_Level": 2, "m_MetaFlag": 0},
+])
+# fmt: on
+# m_PathID type in a MonoBehaviour's own typetree -> its head
+MONOBEHAVIOUR_HEADS = {
+    "SInt64": MONOBEHAVIOUR_HEAD,
+    "int": MONOBEHAVIOUR_HEAD_32,
+    "SInt32": MONOBEHAVIOUR_HEAD_32,
+}
 
-    match reader.type:
-        case ClassIDType.MonoBehaviour:
-            mono: MonoBehaviour = reader.read(check_read=False)
-            script = mono.m_Script.read()
-            nameSpace = script.m_Namespace
-            className = script.m_Name
+
+def monobehaviour_head(reader: ObjectReader) -> TypeTreeNode | None:
+    """MONOBEHAVIOUR_HEAD or MONOBEHAVIOUR_HEAD_32, whichever the MonoBehaviour at reader starts with
+
+    That's told by its own typetree if it has one, and by the serialized file version otherwise.
+    None if its typetree doesn't start like either, in which case it has to be read whole
+    """
+    node = reader.serialized_type.node if reader.serialized_type else None
+    if node is None:
+        if reader.assets_file.header.version >= 14:
+            return MONOBEHAVIOUR_HEAD
+        return MONOBEHAVIOUR_HEAD_32
+    fields = [child.m_Name for child in node.m_Children[:3]]
+    if fields != ["m_GameObject", "m_Enabled", "m_Script"]:
+        return None
+    return MONOBEHAVIOUR_HEADS.get(node.m_Children[0].m_Children[-1].m_Type, None)
+
+
+# (MonoScript file, MonoScript path_id) -> full class name
+SCRIPT_CACHE = dict()
+
+
+def read_script_fullname(reader: ObjectReader) -> str | None:
+    """Resolve the full class name of a MonoBehaviour's script without reading the MonoBehaviour itself"""
+    head = reader.read_typetree(monobehaviour_head(reader), check_read=False)
+    file_id, path_id = head["m_Script"]["m_FileID"], head["m_Script"]["m_PathID"]
+    if not path_id:
+        return None
+    assets_file = reader.assets_file
+    if file_id == 0:
+        key = (assets_file.name, path_id)
+    elif file_id - 1 < len(assets_file.externals):
+        key = (assets_file.externals[file_id - 1].path, path_id)
+    else:
+        return None
+    if key not in SCRIPT_CACHE:
+        try:
+            ptr = PPtr(m_FileID=file_id, m_PathID=path_id, assetsfile=assets_file)
+            script = ptr.deref().read()
             if script.m_Namespace:
-                fullName = script.m_Namespace + "." + className
+                SCRIPT_CACHE[key] = script.m_Namespace + "." + script.m_Name
             else:
-                fullName = className
-            clazz = UTTCGen_GetClass(fullName)
+                SCRIPT_CACHE[key] = script.m_Name
+        except Exception as e:
+            logger.debug(f"Failed to resolve MonoScript {key}: {e}")
+            SCRIPT_CACHE[key] = None
+    return SCRIPT_CACHE[key]
+
+
+class ObjectCache:
+    """LRU cache of objects read by read_from, keyed by (assets file, path_id)
+
+    Cached objects keep their assets file alive, so clear() it before releasing an Environment
+    """
+
+    # Read once per export and large, not worth keeping around
+    UNCACHED = {ClassIDType.Texture2D, ClassIDType.AnimationClip}
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.objects = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, reader: ObjectReader, read):
+        if not self.maxsize or reader.type in self.UNCACHED:
+            return read(reader)
+        # The cached object references the assets file, so its id stays unique while it's here
+        key = (id(reader.assets_file), reader.path_id)
+        if key in self.objects:
+            self.hits += 1
+            self.objects.move_to_end(key)
+            return self.objects[key]
+        self.misses += 1
+        obj = self.objects[key] = read(reader)
+        if len(self.objects) > self.maxsize:
+            self.objects.popitem(last=False)
+        return obj
+
+    def clear(self):
+        self.objects.clear()
+
+    def log_stats(self, level: int = logging.INFO):
+        if self.hits or self.misses:
+            logger.log(
+                level,
+                "Object cache: %d hits, %d misses (%.1f%%)"
+                % (self.hits, self.misses, 100 * self.hits / (self.hits + self.misses)),
+            )
+
+
+OBJECT_CACHE = ObjectCache(FLAGS.object_cache)
+
+
+class StageTimer:
+    """Times consecutive stages of work on the current thread, see Profiler.timer"""
+
+    def __init__(self, profiler: "Profiler", model: str = None):
+        self.profiler = profiler
+        self.model = model
+        self.wall, self.cpu = time.perf_counter(), time.thread_time()
+
+    def lap(self, stage: str, objects: int = 0, bytes: int = 0):
+        """Record the time since the last lap (or the timer's creation) under `stage`"""
+        wall, cpu = time.perf_counter(), time.thread_time()
+        self.profiler.add(
+            stage,
+            self.model,
+            {
+                "calls": 1,
+                "wall": wall - self.wall,
+                "cpu": cpu - self.cpu,
+                "objects": objects,
+                "bytes": bytes,
+            },
+        )
+        self.wall, self.cpu = wall, cpu
+
+
+class NullTimer:
+    def lap(self, stage: str, objects: int = 0, bytes: int = 0):
+        pass
+
+
+class Profiler:
+    """Calls, wall/CPU time, objects and bytes per stage, and per model, for --profile
+
+    Stages are summed over every thread and worker process, so together they can take
+    longer than the run did. Workers hand theirs over to the parent with profiled()"""
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.stages = dict()
+        self.models = dict()
+
+    def timer(self, model: str = None) -> StageTimer | NullTimer:
+        return StageTimer(self, model) if self.enabled else NullTimer()
+
+    def add(self, stage: str, model: str | None, record: dict):
+        with self.lock:
+            self.accumulate(self.stages, stage, record)
+            if model is not None:
+                self.accumulate(self.models.setdefault(model, dict()), stage, record)
+
+    @staticmethod
+    def accumulate(stages: dict, stage: str, record: dict):
+        total = stages.setdefault(stage, dict.fromkeys(record, 0))
+        for k, v in record.items():
+            total[k] += v
+
+    def take(self) -> dict | None:
+        """Stats recorded so far, which are then cleared"""
+        if not self.enabled:
+            return None
+        with self.lock:
+            stats = {"stages": self.stages, "models": self.models}
+            self.stages, self.models = dict(), dict()
+        return stats
+
+    def merge(self, stats: dict | None):
+        """Add the stats take() returned in another process"""
+        if not stats:
+            return
+        with self.lock:
+            for stage, record in stats["stages"].items():
+                self.accumulate(self.stages, stage, record)
+            for model, stages in stats["models"].items():
+                for stage, record in stages.items():
+                    self.accumulate(
+                        self.models.setdefault(model, dict()), stage, record
+                    )
+
 
+PROFILE = Profiler()
+
+
+def profiled(fn, *args):
+    """Call fn in a worker process, returning its result along with the PROFILE stats it recorded"""
+    return fn(*args), PROFILE.take()
+
+
+def profiled_result(future):
+    """Result of a profiled() future, merging its stats into PROFILE"""
+    result, stats = future.result()
+    PROFILE.merge(stats)
+    return result
+
+
+def read_from(reader: ObjectReader, **kwargs):
+    """Import generated classes by MonoBehavior script class type and read from reader
+
+    Objects are cached in OBJECT_CACHE unless `kwargs` are given"""
+    if kwargs:
+        return read_uncached(reader, **kwargs)
+    return OBJECT_CACHE.get(reader, read_uncached)
+
+
+# XXX: Is monkey patching this into UnityPy a good idea?
+def read_uncached(reader: ObjectReader, **kwargs):
+    match reader.type:
+        case ClassIDType.MonoBehaviour:
+            fullName = read_script_fullname(reader)
+            clazz = UTTCGen_GetClass(fullName) if fullName else None
             if clazz:
                 instance = UTTCGen_AsInstance(clazz, reader)
                 return instance
             else:
                 logger.debug(f"Missing definitions for {fullName}, skipping.")
-                return mono
+                return reader.read(check_read=False)
         case _:
             return reader.read(**kwargs)
 
@@ -189,9 +446,1718 @@ def read_from_ptr(ptr: PPtr[T], reader: ObjectReader) -> T:
     return read_from(ptr.deref(reader.assets_file))
 
 
+def read_moc_bytes(reader: ObjectReader) -> memoryview | bytes:
+    """Read CubismMoc._bytes straight from the object's data, skipping the List[int] typetree decode
+
+    Returns a view over the loaded asset when possible, otherwise a single copy of the payload.
+    CubismMocs with typetrees of their own that aren't laid out as expected are read with read_typetree
+    """
+    head = monobehaviour_head(reader)
+    node = reader.serialized_type.node if reader.serialized_type else None
+    if head is None or (
+        node is not None
+        and [child.m_Name for child in node.m_Children[3:5]] != ["m_Name", "_bytes"]
+    ):
+        return bytes(reader.read_typetree(check_read=False)["_bytes"])
+    stream = reader.reader
+    read_path_id = stream.read_long if head is MONOBEHAVIOUR_HEAD else stream.read_int
+    reader.reset()
+    stream.read_int(), read_path_id()  # m_GameObject
+    stream.read_u_byte()  # m_Enabled
+    stream.align_stream()
+    stream.read_int(), read_path_id()  # m_Script
+    stream.read_aligned_string()  # m_Name
+    size = stream.read_int()  # _bytes
+    if size < 0 or stream.Position + size > reader.byte_start + reader.byte_size:
+        raise ValueError("Invalid CubismMoc._bytes size %d" % size)
+    if hasattr(stream, "view"):
+        return stream.view[stream.Position : stream.Position + size]
+    return stream.read_bytes(size)
+
+
+# Newest moc3 version known to keep the section offset table read_moc3_ids relies on
+MOC3_VERSION_MAX = 6
+MOC3_ID_SIZE = 0x40
+
+
+def read_moc3_ids(moc: memoryview | bytes) -> tuple[list[str], list[str]]:
+    """Part and Parameter IDs of a moc3, like sssekai's read_moc3 but over a buffer
+
+    Only the header, the count table and the two ID tables are touched. Raises ValueError
+    early for anything that doesn't look like an unobfuscated little-endian moc3"""
+    view = memoryview(moc).cast("B")
+    if len(view) < 0x10C or view[:4] != b"MOC3":
+        raise ValueError("Not a MOC3 header, the moc may be obfuscated")
+    version, big_endian = view[4], view[5]
+    if not version:
+        raise ValueError("Invalid MOC3 version 0, the moc may be obfuscated")
+    if big_endian:
+        raise ValueError("Big-endian MOC3 is not supported")
+    if version > MOC3_VERSION_MAX:
+        logger.debug(
+            "MOC3 version %d is newer than %d, reading anyway"
+            % (version, MOC3_VERSION_MAX)
+        )
+    (counts,) = struct.unpack_from("<I", view, 0x40)
+    (parts,) = struct.unpack_from("<I", view, 0x4C)
+    (parameters,) = struct.unpack_from("<I", view, 0x108)
+    if counts + 0x18 > len(view):
+        raise ValueError("MOC3 count table out of bounds")
+    (num_parts,) = struct.unpack_from("<I", view, counts)
+    (num_parameters,) = struct.unpack_from("<I", view, counts + 0x14)
+
+    def read_ids(offset: int, count: int) -> list[str]:
+        if offset + count * MOC3_ID_SIZE > len(view):
+            raise ValueError("MOC3 ID table out of bounds")
+        table = bytes(view[offset : offset + count * MOC3_ID_SIZE])
+        return [
+            table[i : i + MOC3_ID_SIZE].partition(b"\0")[0].decode("utf-8")
+            for i in range(0, len(table), MOC3_ID_SIZE)
+        ]
+
+    return read_ids(parts, num_parts), read_ids(parameters, num_parameters)
+
+
+def link_or_copy(src: str, dst: str):
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+class DirectoryOutput:
+    """Output backend writing files to where their paths point to. Directories are made as needed"""
+
+    def __init__(self):
+        self.dirs = set()
+        # Files written since the last close(), for fsync="flush"
+        self.written = list()
+
+    def makedirs(self, path: str):
+        parent = os.path.dirname(path)
+        if parent not in self.dirs:
+            os.makedirs(parent, exist_ok=True)
+            self.dirs.add(parent)
+
+    def write(self, path: str, data, fsync: str):
+        self.makedirs(path)
+        with open(path, "w" if isinstance(data, str) else "wb") as f:
+            f.write(data)
+            if fsync == "each":
+                f.flush()
+                os.fsync(f.fileno())
+        if fsync == "flush":
+            self.written.append(path)
+
+    def link(self, src: str, dst: str):
+        # A model may have nothing but shared textures, so this can be the first file in its directory
+        self.makedirs(dst)
+        link_or_copy(src, dst)
+
+    def close(self, fsync: str):
+        written, self.written = self.written, list()
+        for path in written:
+            with open(path, "rb") as f:
+                os.fsync(f.fileno())
+
+
+class ArchiveOutput:
+    """Output backend writing files under `root` into zip or tar archives there instead
+
+    With `per_model` every top level directory (that is, each model and Animation) gets its own
+    archive, otherwise everything goes into `name`. Paths inside are the same as they'd be on disk.
+    Archives are closed on close(), and appended to by the writes after that.
+    Members can't be replaced, so only the first file written to a path is kept."""
+
+    def __init__(self, root: str, name: str, format: str, per_model: bool):
+        self.root = root
+        self.name = name
+        self.format = format
+        self.per_model = per_model
+        self.lock = threading.Lock()
+        # Archive path -> open ZipFile/TarFile
+        self.archives = dict()
+        # Archives that were created in this run, and are to be appended to from now on
+        self.created = set()
+        # Archive path -> member names written to it
+        self.members = dict()
+        # (archive path, member name) -> (offset, size) of the data of tar members, for reading them back
+        self.offsets = dict()
+
+    def member(self, path: str) -> tuple[str, str]:
+        """(archive path, member name) of the output file at `path`"""
+        name = os.path.relpath(path, self.root).replace(os.sep, "/")
+        archive = name.split("/")[0] if self.per_model else self.name
+        return os.path.join(self.root, f"{archive}.{self.format}"), name
+
+    def open(self, archive: str):
+        if archive not in self.archives:
+            mode = "a" if archive in self.created else "w"
+            if self.format == "zip":
+                self.archives[archive] = zipfile.ZipFile(archive, mode)
+            else:
+                self.archives[archive] = tarfile.open(archive, mode)
+            self.created.add(archive)
+            self.members.setdefault(archive, set())
+        return self.archives[archive]
+
+    def add(self, archive: str, name: str) -> bool:
+        """Open `archive` and claim `name` in it. False if it's been written already"""
+        self.open(archive)
+        if name in self.members[archive]:
+            logger.warning("%s is in %s already, keeping that one" % (name, archive))
+            return False
+        self.members[archive].add(name)
+        return True
+
+    def put(self, archive: str, name: str, data: bytes):
+        """Write data to `name` in `archive`. Called under the lock"""
+        file = self.archives[archive]
+        if self.format == "zip":
+            # Images are compressed already
+            stored = name.endswith(".png")
+            compression = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+            file.writestr(name, data, compress_type=compression)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size, info.mtime = len(data), time.time()
+            file.addfile(info, io.BytesIO(data))
+            blocks = -(-len(data) // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+            self.offsets[archive, name] = file.offset - blocks, len(data)
+
+    def read(self, archive: str, name: str) -> bytes:
+        """Data of a member written in this run. Called under the lock"""
+        if self.format == "zip":
+            # Zip members can be read back from an archive that's still being written
+            return self.open(archive).read(name)
+        # ...but tar ones can't, so read the data from where put() left it
+        if archive in self.archives:
+            self.archives[archive].fileobj.flush()
+        offset, size = self.offsets[archive, name]
+        with open(archive, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
+
+    def write(self, path: str, data, fsync: str):
+        archive, name = self.member(path)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        with self.lock:
+            if self.add(archive, name):
+                self.put(archive, name, data)
+
+    def link(self, src: str, dst: str):
+        src_archive, src_name = self.member(src)
+        archive, name = self.member(dst)
+        with self.lock:
+            if not self.add(archive, name):
+                return
+            if self.format == "tar" and src_archive == archive:
+                # A hard link to the member with the data, as in DirectoryOutput
+                info = tarfile.TarInfo(name)
+                info.type, info.linkname = tarfile.LNKTYPE, src_name
+                info.mtime = time.time()
+                self.archives[archive].addfile(info)
+            else:
+                self.put(archive, name, self.read(src_archive, src_name))
+
+    def close(self, fsync: str):
+        with self.lock:
+            archives, self.archives = self.archives, dict()
+            for archive, file in archives.items():
+                file.close()
+                if fsync != "never":
+                    with open(archive, "rb") as f:
+                        os.fsync(f.fileno())
+
+
+class WriteBehind:
+    """Writes output files on background threads, so decoding the next object overlaps with writing the last
+
+    Up to `limit` bytes (or characters, for text) may be queued, after which write() blocks until the
+    writers catch up. Errors are raised by flush(), which must be called before relying on the files.
+    Files are written by `backend`, see DirectoryOutput and ArchiveOutput.
+
+    `fsync` is one of "never", "each" (every file as it is written) or "flush" (every file written since the
+    last flush, on flush). With no `workers` files are written right away instead."""
+
+    def __init__(self, workers: int = 2, limit: int = 64 << 20, fsync: str = "never"):
+        self.workers = workers
+        self.limit = limit
+        self.fsync = fsync
+        self.backend = DirectoryOutput()
+        self.pool = None
+        self.pending = 0
+        self.cond = threading.Condition()
+        self.futures = list()
+
+    def write(self, path: str, data: str | bytes | memoryview) -> int:
+        """Queue data to be written to path, as text if it's a str. Returns its length"""
+        size = len(data)
+        if not self.workers:
+            self.write_now(path, data)
+            return size
+        with self.cond:
+            self.cond.wait_for(
+                lambda: not self.pending or self.pending + size <= self.limit
+            )
+            self.pending += size
+            # Under the lock, since TexturePipeline's threads write too
+            if self.pool is None:
+                self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix="write")
+            self.futures.append(self.pool.submit(self.write_queued, path, data, size))
+        return size
+
+    def write_queued(self, path: str, data, size: int):
+        try:
+            self.write_now(path, data)
+        finally:
+            with self.cond:
+                self.pending -= size
+                self.cond.notify_all()
+
+    def write_now(self, path: str, data):
+        timer = PROFILE.timer()
+        self.backend.write(path, data, self.fsync)
+        timer.lap("write", 1, len(data))
+
+    def link(self, src: str, dst: str):
+        """Make dst a copy of the flushed src, hard linked where possible"""
+        self.backend.link(src, dst)
+
+    def flush(self):
+        """Wait for every queued write, raising the first error if any failed"""
+        futures, self.futures = self.futures, list()
+        for future in futures:
+            future.result()
+        self.backend.close(self.fsync)
+
+
+OUTPUT = WriteBehind()
+
+
+def json_default(obj):
+    """Encode numpy arrays and scalars (i.e. from --numpy-arrays fields) as lists and numbers"""
+    if np is not None and isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError("Object of type %s is not JSON serializable" % type(obj).__name__)
+
+
+def dump_json_stdlib(obj) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=json_default)
+
+
+def dump_json_orjson(obj) -> bytes:
+    try:
+        # Not OPT_SERIALIZE_NUMPY, which ignores the byte order of big-endian arrays
+        return orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+    except (
+        TypeError
+    ):  # i.e. integers beyond 64 bits, which only the stdlib encoder takes
+        return dump_json_stdlib(obj)
+
+
+# Compact JSON encoders, by --json-encoder name. "auto" picks the first available one in here
+JSON_ENCODERS = {
+    "orjson": dump_json_orjson if orjson else None,
+    "json": dump_json_stdlib,
+}
+
+
+def dump_json(obj) -> str | bytes:
+    """Serialize obj for an output file, indented by 4 unless --json-compact is set"""
+    if not FLAGS.json_compact:
+        return json.dumps(obj, indent=4, default=json_default)
+    if FLAGS.json_encoder == "auto":
+        return next(filter(None, JSON_ENCODERS.values()))(obj)
+    return JSON_ENCODERS[FLAGS.json_encoder](obj)
+
+
+def write_texture(path: str, data: bytes, *args, model: str = None):
+    """Decode Texture2D image data (see parse_image_data) and queue it to be written to path"""
+    timer = PROFILE.timer(model)
+    image = parse_image_data(data, *args)
+    timer.lap("texture_decode", 1, len(data))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    timer.lap("texture_encode", 1, OUTPUT.write(path, buffer.getbuffer()))
+
+
+# fmt: off
+# TextureFormat -> (block width, block height, bytes per block) of the formats written as they are
+TEXTURE_BLOCKS = {
+    "Alpha8": (1, 1, 1), "R8": (1, 1, 1), "RG16": (1, 1, 2), "RGB24": (1, 1, 3), "RGBA32": (1, 1, 4), "BGRA32": (1, 1, 4),
+    "RHalf": (1, 1, 2), "RGHalf": (1, 1, 4), "RGBAHalf": (1, 1, 8), "RFloat": (1, 1, 4), "RGFloat": (1, 1, 8), "RGBAFloat": (1, 1, 16),
+    "DXT1": (4, 4, 8), "DXT3": (4, 4, 16), "DXT5": (4, 4, 16), "BC4": (4, 4, 8), "BC5": (4, 4, 16), "BC6H": (4, 4, 16), "BC7": (4, 4, 16),
+    "ETC_RGB4": (4, 4, 8), "ETC2_RGB": (4, 4, 8), "ETC2_RGBA8": (4, 4, 16),
+    **{f"ASTC_{c}_{n}x{n}": (n, n, 16) for c in ("RGB", "RGBA") for n in (4, 5, 6, 8, 10, 12)},
+}
+# TextureFormat -> (VkFormat, sRGB VkFormat or None, DFD color model, DFD samples as (bit offset, bit length, channel))
+KTX2_FORMATS = {
+    "R8": (9, None, 1, [(0, 8, 0)]),
+    "RG16": (16, None, 1, [(0, 8, 0), (8, 8, 1)]),
+    "RGB24": (23, 29, 1, [(0, 8, 0), (8, 8, 1), (16, 8, 2)]),
+    "RGBA32": (37, 43, 1, [(0, 8, 0), (8, 8, 1), (16, 8, 2), (24, 8, 15)]),
+    "BGRA32": (44, 50, 1, [(0, 8, 2), (8, 8, 1), (16, 8, 0), (24, 8, 15)]),
+    "DXT1": (131, 132, 128, [(0, 64, 0)]),
+    "DXT5": (137, 138, 130, [(0, 64, 15), (64, 64, 0)]),
+    "BC4": (139, None, 131, [(0, 64, 0)]),
+    "BC5": (141, None, 132, [(0, 64, 0), (64, 64, 1)]),
+    "BC7": (145, 146, 134, [(0, 128, 0)]),
+    # ETC1 blocks are valid ETC2 RGB ones
+    "ETC_RGB4": (147, 148, 161, [(0, 64, 2)]),
+    "ETC2_RGB": (147, 148, 161, [(0, 64, 2)]),
+    "ETC2_RGBA8": (151, 152, 161, [(0, 64, 15), (64, 64, 2)]),
+    **{f"ASTC_{c}_{n}x{n}": (vk, vk + 1, 162, [(0, 128, 0)]) for c in ("RGB", "RGBA")
+       for n, vk in ((4, 157), (5, 161), (6, 165), (8, 171), (10, 179), (12, 183))},
+}
+# TextureFormat -> (DXGI_FORMAT, sRGB DXGI_FORMAT or None)
+DDS_FORMATS = {
+    "Alpha8": (65, None), "R8": (61, None), "RG16": (49, None), "RGBA32": (28, 29), "BGRA32": (87, 91),
+    "RHalf": (54, None), "RGHalf": (34, None), "RGBAHalf": (10, None), "RFloat": (41, None), "RGFloat": (16, None), "RGBAFloat": (2, None),
+    "DXT1": (71, 72), "DXT3": (74, 75), "DXT5": (77, 78), "BC4": (80, None), "BC5": (83, None),
+}
+# TextureFormat -> (start, end, row bits) of the per-row index fields in its blocks.
+# DDS is top-down, so blocks are flipped by reversing their rows. BC6H/BC7 blocks can't be
+# flipped without re-encoding them, and are left out of DDS_FORMATS
+DDS_BLOCK_ROWS = {
+    "DXT1": [(4, 8, 8)], "DXT3": [(0, 8, 16), (12, 16, 8)], "DXT5": [(2, 8, 12), (12, 16, 8)],
+    "BC4": [(2, 8, 12)], "BC5": [(2, 8, 12), (10, 16, 12)],
+}
+# fmt: on
+KTX2_IDENTIFIER = b"\xabKTX 20\xbb\r\n\x1a\n"
+# Unity stores images bottom-up
+KTX2_ORIENTATION = b"KTXorientation\0ru\0"
+
+
+def texture_levels(tex: Texture2D) -> int:
+    """Number of mip levels in the image data of tex"""
+    if getattr(tex, "m_MipCount", None):
+        return tex.m_MipCount
+    if getattr(tex, "m_MipMap", False):
+        return max(tex.m_Width, tex.m_Height).bit_length()
+    return 1
+
+
+def texture_level_sizes(texture_format: str, width: int, height: int, levels: int):
+    """Size in bytes of every mip level of an image, largest (i.e. first in Unity's image data) first"""
+    bw, bh, size = TEXTURE_BLOCKS[texture_format]
+    return [
+        -(-max(1, width >> i) // bw) * -(-max(1, height >> i) // bh) * size
+        for i in range(levels)
+    ]
+
+
+def texture_container(tex: Texture2D) -> str:
+    """Container, and extension, tex is written in. That's --texture-format, unless its image data
+    can't be put in there as it is (unsupported, crunched or swizzled) and is decoded into a PNG instead
+    """
+    container = FLAGS.texture_format
+    if container == "png":
+        return container
+    if getattr(tex, "m_PlatformBlob", None):
+        return "png"
+    try:
+        texture_format = TextureFormat(tex.m_TextureFormat).name
+    except ValueError:
+        return "png"
+    formats = {"raw": TEXTURE_BLOCKS, "ktx2": KTX2_FORMATS, "dds": DDS_FORMATS}
+    if texture_format not in formats[container]:
+        return "png"
+    levels = texture_levels(tex)
+    sizes = texture_level_sizes(texture_format, tex.m_Width, tex.m_Height, levels)
+    if sum(sizes) != getattr(tex, "m_CompleteImageSize", None):
+        return "png"
+    if container == "dds":
+        # Partial block rows can't be flipped in place
+        bh = TEXTURE_BLOCKS[texture_format][1]
+        heights = (max(1, tex.m_Height >> i) for i in range(levels))
+        if any(h % bh and h > bh for h in heights):
+            return "png"
+    return container
+
+
+def ktx2_dfd(texture_format: str, srgb: bool) -> bytes:
+    """KTX2 Data Format Descriptor with a single basic descriptor block"""
+    _, _, model, samples = KTX2_FORMATS[texture_format]
+    bw, bh, size = TEXTURE_BLOCKS[texture_format]
+    transfer = 2 if srgb else 1
+    body = struct.pack(
+        "<4B4B8B", model, 1, transfer, 0, bw - 1, bh - 1, 0, 0, size, *bytes(7)
+    )
+    for offset, length, channel in samples:
+        if srgb and channel == 15:
+            channel |= 0x10  # Alpha stays linear
+        upper = (1 << length) - 1 if model == 1 else 0xFFFFFFFF
+        body += struct.pack("<HBB4xII", offset, length - 1, channel, 0, upper)
+    block = struct.pack("<IHH", 0, 2, 8 + len(body)) + body
+    return struct.pack("<I", 4 + len(block)) + block
+
+
+def ktx2_container(
+    data: bytes, texture_format: str, width: int, height: int, levels: int, srgb: bool
+) -> bytes:
+    """Image data as a KTX2 file. Mip levels are laid out smallest first, as the spec wants them"""
+    vk, vk_srgb, _, _ = KTX2_FORMATS[texture_format]
+    srgb = srgb and vk_srgb is not None
+    dfd = ktx2_dfd(texture_format, srgb)
+    kvd = struct.pack("<I", len(KTX2_ORIENTATION)) + KTX2_ORIENTATION
+    kvd += bytes(-len(kvd) % 4)
+    sizes = texture_level_sizes(texture_format, width, height, levels)
+    starts = [0, *accumulate(sizes)]
+    dfd_offset = 80 + 24 * levels
+    kvd_offset = dfd_offset + len(dfd)
+    offset = kvd_offset + len(kvd)
+    align = lcm(TEXTURE_BLOCKS[texture_format][2], 4)
+    offsets, chunks = [0] * levels, []
+    for level in reversed(range(levels)):
+        padding = -offset % align
+        offsets[level] = offset = offset + padding
+        chunks += (bytes(padding), data[starts[level] : starts[level + 1]])
+        offset += sizes[level]
+    header = KTX2_IDENTIFIER + struct.pack(
+        "<9I", vk_srgb if srgb else vk, 1, width, height, 0, 0, 1, levels, 0
+    )
+    header += struct.pack("<4I2Q", dfd_offset, len(dfd), kvd_offset, len(kvd), 0, 0)
+    header += b"".join(
+        struct.pack("<3Q", offsets[level], sizes[level], sizes[level])
+        for level in range(levels)
+    )
+    return b"".join((header, dfd, kvd, *chunks))
+
+
+def flip_block_rows(fields: bytes, length: int, bits: int, rows: int) -> bytes:
+    """Reverse the first `rows` rows, `bits` wide each, of every `length` byte field in fields"""
+    count = len(fields) // length
+    repeat = lambda mask: int.from_bytes(
+        mask.to_bytes(length, "little") * count, "little"
+    )
+    x = int.from_bytes(fields, "little")
+    row = repeat((1 << bits) - 1)
+    # Rows past `rows` (i.e. padding of partial blocks) stay where they are
+    flipped = x & repeat((1 << 8 * length) - (1 << bits * rows))
+    for i in range(rows):
+        flipped |= (x >> bits * (rows - 1 - i) & row) << bits * i
+    return flipped.to_bytes(len(fields), "little")
+
+
+def dds_flip(level: bytes, texture_format: str, width: int, height: int) -> bytes:
+    """Flip one mip level of Unity's bottom-up image data top-down, by rows of blocks.
+    Rows inside the blocks are flipped too, see DDS_BLOCK_ROWS"""
+    bw, bh, size = TEXTURE_BLOCKS[texture_format]
+    if bh > 1:
+        level = bytearray(level)
+        for start, end, bits in DDS_BLOCK_ROWS[texture_format]:
+            length = end - start
+            fields = bytearray(len(level) // size * length)
+            for i in range(length):
+                fields[i::length] = level[start + i :: size]
+            fields = flip_block_rows(fields, length, bits, min(height, bh))
+            for i in range(length):
+                level[start + i :: size] = fields[i::length]
+    pitch = -(-width // bw) * size
+    return b"".join(level[i - pitch : i] for i in range(len(level), 0, -pitch))
+
+
+def dds_container(
+    data: bytes, texture_format: str, width: int, height: int, levels: int, srgb: bool
+) -> bytes:
+    """Image data as a DDS file with a DX10 header. Mip levels are laid out largest first, as Unity has
+    them, and flipped top-down since DDS has no way to tell they're not"""
+    dxgi, dxgi_srgb = DDS_FORMATS[texture_format]
+    bw, _, size = TEXTURE_BLOCKS[texture_format]
+    sizes = texture_level_sizes(texture_format, width, height, levels)
+    # CAPS | HEIGHT | WIDTH | PIXELFORMAT, LINEARSIZE or PITCH, MIPMAPCOUNT
+    flags = 0x1007 | (0x80000 if bw > 1 else 0x8) | (0x20000 if levels > 1 else 0)
+    pitch = sizes[0] if bw > 1 else width * size
+    # TEXTURE, COMPLEX | MIPMAP
+    caps = 0x1000 | (0x400008 if levels > 1 else 0)
+    header = b"DDS " + struct.pack(
+        "<7I44x2I4s5I5I",
+        *(124, flags, height, width, pitch, 0, levels),
+        *(32, 0x4, b"DX10", 0, 0, 0, 0, 0),  # DDS_PIXELFORMAT, FOURCC
+        *(caps, 0, 0, 0, 0),
+    )
+    # DXGI_FORMAT, TEXTURE2D, no flags, array size 1
+    header += struct.pack("<5I", dxgi_srgb if srgb and dxgi_srgb else dxgi, 3, 0, 1, 0)
+    starts = [0, *accumulate(sizes)]
+    return header + b"".join(
+        dds_flip(
+            data[starts[i] : starts[i + 1]],
+            texture_format,
+            max(1, width >> i),
+            max(1, height >> i),
+        )
+        for i in range(levels)
+    )
+
+
+TEXTURE_CONTAINERS = {"ktx2": ktx2_container, "dds": dds_container}
+
+
+def write_texture_container(
+    path: str,
+    container: str,
+    data: bytes,
+    texture_format: int,
+    *args,
+    model: str = None,
+):
+    """Queue Texture2D image data to be written to path as it is, bare (raw) or in a KTX2/DDS container.
+    The arguments after texture_format are passed on to the container, see ktx2_container
+    """
+    timer = PROFILE.timer(model)
+    if container in TEXTURE_CONTAINERS:
+        texture_format = TextureFormat(texture_format).name
+        data = TEXTURE_CONTAINERS[container](data, texture_format, *args)
+    timer.lap("texture_container", 1, OUTPUT.write(path, data))
+
+
+class TexturePipeline:
+    """Decodes and writes textures on a thread pool, once per (assets file, path_id)
+
+    Textures claimed earlier, possibly by another process sharing the same `claims` mapping,
+    are queued as links to the first written copy instead. The links can only be made
+    once every writer is done, see finish()."""
+
+    def __init__(self, workers: int, claims: dict = None):
+        self.pool = ThreadPoolExecutor(workers)
+        self.claims = dict() if claims is None else claims
+        self.futures = list()
+        self.links = list()
+        # (claim key, path) of every texture this pipeline writes
+        self.claimed = list()
+
+    def export(self, tex: Texture2D, path: str, model: str = None) -> bool:
+        """Queue tex to be written to path, in the container its extension names (see texture_container).
+        Returns False if it's going to be linked instead
+
+        `model` is the one the texture is profiled under"""
+        reader = tex.object_reader
+        key = (reader.assets_file.name, reader.path_id)
+        src = self.claims.setdefault(key, path)
+        if src != path:
+            self.links.append((src, path))
+            return False
+        self.claimed.append((key, path))
+        # Image data is read here since the underlying streams are not thread safe
+        container = os.path.splitext(path)[1][1:]
+        if container != "png":
+            self.futures.append(
+                self.pool.submit(
+                    write_texture_container,
+                    path,
+                    container,
+                    tex.get_image_data(),
+                    tex.m_TextureFormat,
+                    tex.m_Width,
+                    tex.m_Height,
+                    texture_levels(tex),
+                    getattr(tex, "m_ColorSpace", 1) == 1,
+                    model=model,
+                )
+            )
+            return True
+        self.futures.append(
+            self.pool.submit(
+                write_texture,
+                path,
+                tex.get_image_data(),
+                tex.m_Width,
+                tex.m_Height,
+                tex.m_TextureFormat,
+                getattr(reader, "version", (0, 0, 0, 0)),
+                getattr(reader, "platform", BuildTarget.UnknownPlatform),
+                getattr(tex, "m_PlatformBlob", None),
+                model=model,
+            )
+        )
+        return True
+
+    def wait(self):
+        """Wait for all pending writes, releasing the image data they hold"""
+        futures, self.futures = self.futures, list()
+        for future in futures:
+            future.result()
+
+    def finish(self) -> list[tuple[str, str]]:
+        """Wait for all pending writes and stop the pool
+
+        Returns:
+            list: (src, dst) links that are yet to be made with OUTPUT.link
+        """
+        self.wait()
+        self.pool.shutdown()
+        OUTPUT.flush()
+        return self.links
+
+
+def discover(objects: list[ObjectReader], classes: set[str]):
+    """Yield MonoBehaviour readers whose script is one of the `classes` full names.
+
+    Only the MonoBehaviour head is read here, the rest is left for read_from"""
+    for reader in objects:
+        if reader.type == ClassIDType.MonoBehaviour:
+            if read_script_fullname(reader) in classes:
+                yield reader
+
+
+def container_path(reader: ObjectReader) -> str | None:
+    """Container path the asset bundle lists the object under, if any"""
+    return reader.assets_file.container.path_dict.get(reader.path_id)
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Regular expression for a --include/--exclude pattern, see model_matches"""
+    if pattern.startswith("re:"):
+        return re.compile(pattern[3:])
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+
+
+def model_matches(name: str, container: str | None) -> bool:
+    """Whether a model passes --include/--exclude, by its GameObject's name or container path
+
+    Patterns are case-insensitive globs, or regular expressions (searched for) when prefixed with re:
+    """
+
+    def matches(pattern: str) -> bool:
+        regex = compile_pattern(pattern)
+        match = regex.search if pattern.startswith("re:") else regex.match
+        return any(match(s) for s in (name, container) if s is not None)
+
+    if FLAGS.include and not any(map(matches, FLAGS.include)):
+        return False
+    return not any(map(matches, FLAGS.exclude))
+
+
+def model_selected(reader: ObjectReader) -> bool:
+    """model_matches for the CubismModel MonoBehaviour at reader. Only its GameObject is read for that"""
+    if not FLAGS.include and not FLAGS.exclude:
+        return True
+    head = reader.read_typetree(monobehaviour_head(reader), check_read=False)
+    head = head["m_GameObject"]
+    ptr = PPtr(
+        m_FileID=head["m_FileID"],
+        m_PathID=head["m_PathID"],
+        assetsfile=reader.assets_file,
+    )
+    obj_reader = ptr.deref()
+    name = read_from(obj_reader).m_Name
+    if model_matches(name, container_path(obj_reader)):
+        return True
+    logger.debug(f"Skipping {name}, filtered out")
+    return False
+
+
+def children_recursive(obj: GameObject):
+    """Yield every GameObject in the hierarchy below `obj`"""
+    transform: Transform = read_from_ptr(obj.m_Transform, obj)
+    for child in transform.m_Children:
+        child = read_from_ptr(child, obj)
+        ch_obj = read_from_ptr(child.m_GameObject, child)
+        yield ch_obj
+        yield from children_recursive(ch_obj)
+
+
+def export_model(OBJ: GameObject, outdir: str, textures: TexturePipeline) -> dict:
+    """Export a Live2D model rooted at OBJ into outdir/<name>
+
+    Textures are handed over to `textures` and may not be written yet when this returns
+
+    Returns:
+        dict: CRC32 -> Part/Parameter path table of the model
+    """
+    crc_cache = dict()
+    timer = PROFILE.timer(OBJ.m_Name)
+    # fmt: off
+    components = [read_from_ptr(ptr, OBJ) for ptr in OBJ.m_Components]
+    timer.lap("components", len(components))
+    NAME = OBJ.m_Name
+    MOC : CubismModel = next(filter(lambda x: isinstance(x, CubismModel), components), None)        
+    PHY : CubismPhysicsController = next(filter(lambda x: isinstance(x, CubismPhysicsController), components), None)
+    # ANI : Animator = next(filter(lambda x: isinstance(x, Animator), components), None)
+    # RND : CubismRenderController = next(filter(lambda x: isinstance(x, CubismRenderController), components), None)
+    logger.info(f"Processing {NAME}")
+    outdir = os.path.join(outdir, NAME)
+    metadata = {
+        "Version": 3,
+        "FileReferences": {
+            "Moc":"",
+            "Textures": [],
+            "Physics": ""
+        },
+    }
+    if MOC:
+        fname = metadata["FileReferences"]["Moc"] = f"{NAME}.moc3"
+        moc = read_moc_bytes(MOC._moc.deref(MOC.object_reader.assets_file))
+        logger.info(".moc3: %d bytes" % OUTPUT.write(os.path.join(outdir, fname), moc))
+        try:
+            parts, parameters = read_moc3_ids(moc)
+            for s in parts:
+                path = "Parts/" + s
+                crc_cache[crc32(path.encode("utf-8"))] = path
+            for s in parameters:
+                path = "Parameters/" + s
+                crc_cache[crc32(path.encode("utf-8"))] = path
+            logger.info(".moc3: %d parts, %d parameters" % (len(parts), len(parameters)))
+        except Exception as e:
+            logger.warning("Failed to parse MOC3: %s" % e)
+            logger.warning("This may indicate obfuscation or a different format")
+        timer.lap("moc", 1, len(moc))
+    if PHY:
+        fname = metadata["FileReferences"]["Physics"] = f"{NAME}.physics3.json"
+        physics = dump_json(PHY.dump())
+        logger.info(".physics3.json: %d bytes" % OUTPUT.write(os.path.join(outdir, fname), physics))
+        timer.lap("physics", 1, len(physics))
+    # Renderers are bound to the meshes in the hierarchy
+    # Mark referenced textures
+    TEX = set()
+    for child in children_recursive(OBJ):
+        components = [read_from_ptr(ptr, child) for ptr in child.m_Components]
+        RND : CubismRenderer = next(filter(lambda x: isinstance(x, CubismRenderer), components), None)
+        if RND:
+            TEX.add(RND)
+    timer.lap("hierarchy", len(TEX))
+    if TEX:
+        metadata["FileReferences"]["Textures"] = []
+        for tex in TEX:
+            tex : CubismRenderer
+            tex : Texture2D = read_from_ptr(tex._mainTexture, tex)                
+            path = f"Textures/{tex.m_Name}.{texture_container(tex)}"
+            metadata["FileReferences"]["Textures"].append(path)                
+            path = os.path.join(outdir, path)
+            if textures.export(tex, path, NAME):
+                logger.info(f"[texture]: {tex.m_Name}")
+            else:
+                logger.info(f"[texture]: {tex.m_Name} (shared)")
+        # XXX: Lexical. But why?
+        metadata["FileReferences"]["Textures"].sort()
+        timer.lap("textures", len(TEX))
+    path = f"{NAME}.model3.json"
+    timer.lap("metadata", 1, OUTPUT.write(os.path.join(outdir,path), dump_json(metadata)))
+    logger.info(f"[metadata]: {path}")
+    # fmt: on
+    return crc_cache
+
+
+def setup_output(flags: ExtractorFlags):
+    OUTPUT.workers = flags.write_jobs
+    OUTPUT.limit = flags.write_buffer << 20
+    OUTPUT.fsync = flags.fsync
+
+
+def setup_logging(level: str):
+    coloredlogs.install(
+        level=level,
+        fmt="%(asctime)s %(name)s [%(levelname).4s] %(message)s",
+        isatty=True,
+    )
+
+
+def source_files(env: UnityPy.Environment) -> dict:
+    """Map every serialized file in env to the path of the input file it was loaded from"""
+    sources = dict()
+
+    def walk(file, path):
+        for child in (getattr(file, "files", None) or {}).values():
+            sources[id(child)] = path
+            walk(child, path)
+
+    for path, file in env.files.items():
+        sources[id(file)] = path
+        walk(file, path)
+    return sources
+
+
+def input_files(infile: str) -> tuple[str, list[str]]:
+    """Split infile into the root directory dependencies are resolved from, and the files under it"""
+    if os.path.isdir(infile):
+        files = [os.path.join(r, f) for r, _, fs in os.walk(infile) for f in fs]
+        return infile, sorted(files)
+    return os.path.dirname(infile) or os.curdir, [infile]
+
+
+def map_file(path: str) -> memoryview | io.BufferedReader:
+    """Map the file at `path` read-only into memory
+
+    Returns:
+        memoryview: Over the mapping, which UnityPy reads from in place. Or the opened file, for the
+        ones that can't be mapped (empty files) or that UnityPy won't take as buffers (zip archives)
+    """
+    f = open(path, "rb")
+    try:
+        if os.fstat(f.fileno()).st_size == 0:
+            return f
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return f
+    if mapped[:4] == b"PK\x03\x04":
+        mapped.close()
+        return f
+    f.close()  # The mapping stays valid on its own
+    return memoryview(mapped)
+
+
+class MappedEnvironment(UnityPy.Environment):
+    """Environment that maps the files it loads from disk into memory, instead of reading them through
+
+    Only the pages objects are actually read from are ever loaded, and the OS is free to drop them again.
+    Mappings are released along with the files once the Environment is gone."""
+
+    def load_files(self, files: list[str]):
+        self.load_assets(files, map_file)
+
+    def load_file(self, file, parent=None, name=None, is_dependency=False):
+        # Dependencies found with find_file are loaded by path too
+        if isinstance(file, str) and not reSplit.match(file):
+            path = file
+            if not os.path.isabs(path) and not os.path.exists(path):
+                path = os.path.join(self.path, path)
+            if os.path.isfile(path):
+                return super().load_file(map_file(path), parent, file, is_dependency)
+        return super().load_file(file, parent, name, is_dependency)
+
+
+def load_input(*args, **kwargs) -> UnityPy.Environment:
+    """UnityPy.load, with the input files mapped into memory unless disabled with --no-mmap"""
+    if FLAGS.mmap:
+        return MappedEnvironment(*args, **kwargs)
+    return UnityPy.Environment(*args, **kwargs)
+
+
+# Input root -> (files, simplified file names) under it, as UnityPy would have listed them
+INPUT_INDEX = dict()
+
+
+def open_input(root: str, path: str) -> UnityPy.Environment:
+    """Open the input file at `path` by itself. Dependencies are loaded on demand from `root`"""
+    env = load_input(path=root)
+    if root not in INPUT_INDEX:
+        _, files = input_files(root)
+        INPUT_INDEX[root] = files, [
+            os.path.join(os.path.dirname(f), simplify_name(os.path.basename(f)))
+            for f in files
+        ]
+    # Saves every Environment from walking the whole root again on its first missing dependency
+    env.local_files, env.local_files_simple = map(list, INPUT_INDEX[root])
+    timer = PROFILE.timer()
+    env.load_file(path)
+    timer.lap("load", 1, os.path.getsize(path))
+    return env
+
+
+def export_input_models(
+    root: str, path: str, outdir: str, textures: TexturePipeline
+) -> dict:
+    """Open the input file at `path` alone and export every model found in it
+
+    Returns:
+        dict: What was extracted, in the form kept by Manifest. That is the CRC32 -> Part/Parameter
+        path table ("crc"), model names ("models"), textures claimed ("textures"), input files loaded
+        as dependencies ("deps") and whether the file has any AnimationClip ("clips")
+    """
+    env = open_input(root, path)
+    # Listed before discovery, which may pull in dependencies
+    objects = env.objects
+    claimed = len(textures.claimed)
+    record = {"crc": dict(), "models": list()}
+    for reader in filter(model_selected, discover(objects, EXPORTED_CLASSES)):
+        OBJ = read_from_ptr(read_from(reader).m_GameObject, reader)
+        record["crc"].update(export_model(OBJ, outdir, textures))
+        record["models"].append(OBJ.m_Name)
+    textures.wait()
+    OBJECT_CACHE.clear()
+    record["textures"] = [[*key, path] for key, path in textures.claimed[claimed:]]
+    record["deps"] = sorted(
+        os.path.relpath(dep, root)
+        for dep in env.files
+        if dep != path and isinstance(dep, str) and os.path.isfile(dep)
+    )
+    record["clips"] = any(r.type == ClassIDType.AnimationClip for r in objects)
+    return record
+
+
+def file_hash(path: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_stat(path: str) -> dict:
+    """Size, mtime_ns and hash of the file at `path`, see file_matches"""
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": file_hash(path)}
+
+
+def file_matches(stat: dict, path: str) -> bool:
+    """Whether the file at `path` still is the one `stat` was taken of
+
+    That's when its size and mtime match, or its size and hash do"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if not stat or stat["size"] != st.st_size:
+        return False
+    return stat["mtime_ns"] == st.st_mtime_ns or stat["hash"] == file_hash(path)
+
+
+class Manifest:
+    """Record of what the last run extracted from each input file, kept in <outdir>/.manifest.json
+
+    An input file is unchanged when it and every dependency it loaded are. A file is taken
+    as unchanged when its size and mtime match, or its size and hash do. Records made with
+    different `options` are discarded."""
+
+    VERSION = 1
+
+    def __init__(self, outdir: str, root: str, options: dict):
+        self.outdir = outdir
+        self.root = root
+        self.options = options
+        self.path = os.path.join(outdir, ".manifest.json")
+        # Input file (relative to root) -> what export_input_models returned for it, and "motions"
+        self.records = dict()
+        # Input file -> size, mtime_ns and hash
+        self.stats = dict()
+        self.checked = dict()
+        # Entries in the --crc-db dictionary when the clips were last converted, None without one
+        self.crc_db = None
+        try:
+            with open(self.path) as f:
+                manifest = json.load(f)
+            if manifest["version"] == self.VERSION:
+                self.stats = manifest["stats"]
+                if manifest["options"] == options:
+                    self.records = manifest["records"]
+                    self.crc_db = manifest.get("crc_db")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable manifest %s: %s" % (self.path, e))
+
+    def file_unchanged(self, rel: str) -> bool:
+        if rel not in self.checked:
+            stat, path = self.stats.get(rel), os.path.join(self.root, rel)
+            self.checked[rel] = file_matches(stat, path)
+            if self.checked[rel]:
+                stat["mtime_ns"] = os.stat(path).st_mtime_ns
+        return self.checked[rel]
+
+    def unchanged(self, path: str) -> bool:
+        """Whether the input file at `path` can be skipped. Must be asked before any update()"""
+        rel = os.path.relpath(path, self.root)
+        record = self.records.get(rel)
+        return bool(record) and all(map(self.file_unchanged, [rel] + record["deps"]))
+
+    def claims(self, paths: list[str]) -> dict:
+        """Texture claims of every recorded file other than `paths`, see TexturePipeline"""
+        skip = {os.path.relpath(path, self.root) for path in paths}
+        return {
+            (cab, path_id): path
+            for rel, record in self.records.items()
+            if rel not in skip
+            for cab, path_id, path in record["textures"]
+        }
+
+    def crc_table(self) -> dict:
+        """Merged CRC32 -> Part/Parameter path table of every recorded file"""
+        return {
+            int(crc): path
+            for record in self.records.values()
+            for crc, path in record["crc"].items()
+        }
+
+    def artifacts(self, record: dict) -> set:
+        return {*record["models"], *record.get("motions", [])}
+
+    def remove_stale(self, rel: str, record: dict):
+        """Delete outputs of the recorded `rel` that `record` and no other file produces"""
+        stale = self.artifacts(self.records.get(rel, {"models": []}))
+        stale -= self.artifacts(record)
+        for other, other_record in self.records.items():
+            if other != rel:
+                stale -= self.artifacts(other_record)
+        for artifact in stale:
+            path = os.path.join(self.outdir, artifact)
+            logger.info("[stale]: %s" % artifact)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            elif os.path.exists(path):
+                os.remove(path)
+
+    def update(self, path: str, record: dict):
+        """Replace the record of the input file at `path`"""
+        rel = os.path.relpath(path, self.root)
+        self.remove_stale(rel, record)
+        self.records[rel] = record
+        for dep in [rel] + record["deps"]:
+            if dep not in self.checked or not self.checked[dep]:
+                self.stats[dep] = file_stat(os.path.join(self.root, dep))
+                self.checked[dep] = True
+
+    def prune(self, paths: list[str]):
+        """Forget input files that are not in `paths` anymore, deleting their outputs"""
+        current = {os.path.relpath(path, self.root) for path in paths}
+        for rel in set(self.records) - current:
+            self.remove_stale(rel, {"models": []})
+            del self.records[rel]
+
+    def save(self):
+        with open(self.path + ".tmp", "w") as f:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "options": self.options,
+                    "records": self.records,
+                    "stats": self.stats,
+                    "crc_db": self.crc_db,
+                },
+                f,
+            )
+        os.replace(self.path + ".tmp", self.path)
+
+
+class CRCDictionary:
+    """Persistent CRC32 -> Part/Parameter path table (--crc-db), accumulated across runs
+
+    Entries are only ever added. The file is memory-mapped and looked up in place by binary search.
+    Its layout is an 8 byte magic, the entry count, the sorted CRC32s, the end offset of each path
+    into the path blob, then the blob of UTF-8 paths. All integers are little-endian u32s.
+    """
+
+    MAGIC = b"L2DCRC\x00\x01"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.mapped, self.views = None, list()
+        self.crcs, self.ends, self.paths = (), (), b""
+        self.load()
+
+    def load(self):
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            header = f.read(12)
+            if len(header) != 12 or header[:8] != self.MAGIC:
+                raise ValueError("%s is not a CRC dictionary" % self.path)
+            (count,) = struct.unpack("<I", header[8:])
+            if not count:
+                return
+            self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self.mapped)
+        if len(view) < 12 + 8 * count:
+            self.close()
+            raise ValueError("%s is truncated" % self.path)
+        crcs, ends = view[12 : 12 + 4 * count], view[12 + 4 * count : 12 + 8 * count]
+        self.views = [view, crcs, ends]
+        if sys.byteorder == "little":
+            crcs, ends = crcs.cast("I"), ends.cast("I")
+            self.views += [crcs, ends]
+        else:
+            crcs, ends = array("I", crcs), array("I", ends)
+            crcs.byteswap(), ends.byteswap()
+        self.crcs, self.ends = crcs, ends
+        self.paths = view[12 + 8 * count :]
+        self.views.append(self.paths)
+
+    def close(self):
+        self.crcs, self.ends, self.paths = (), (), b""
+        for view in reversed(self.views):
+            view.release()
+        self.views = list()
+        if self.mapped:
+            self.mapped.close()
+            self.mapped = None
+
+    def __len__(self):
+        return len(self.crcs)
+
+    def __iter__(self):
+        return iter(self.crcs)
+
+    def __contains__(self, crc: int):
+        i = bisect_left(self.crcs, crc)
+        return i < len(self.crcs) and self.crcs[i] == crc
+
+    def get(self, crc: int, default=None):
+        i = bisect_left(self.crcs, crc)
+        if i == len(self.crcs) or self.crcs[i] != crc:
+            return default
+        return str(self.paths[self.ends[i - 1] if i else 0 : self.ends[i]], "utf-8")
+
+    def __getitem__(self, crc: int) -> str:
+        path = self.get(crc)
+        if path is None:
+            raise KeyError(crc)
+        return path
+
+    def items(self):
+        return ((crc, self[crc]) for crc in self.crcs)
+
+    def update(self, table: dict) -> int:
+        """Add the entries of table that aren't in here yet, and rewrite the file if there were any
+
+        Returns:
+            int: Number of entries added
+        """
+        new = {crc: path for crc, path in table.items() if crc not in self}
+        if not new:
+            return 0
+        entries = dict(self.items())
+        entries.update(new)
+        crcs = sorted(entries)
+        paths = [entries[crc].encode("utf-8") for crc in crcs]
+        with open(self.path + ".tmp", "wb") as f:
+            f.write(self.MAGIC + struct.pack("<I", len(crcs)))
+            f.write(struct.pack("<%dI" % len(crcs), *crcs))
+            f.write(struct.pack("<%dI" % len(crcs), *accumulate(map(len, paths))))
+            f.write(b"".join(paths))
+        self.close()  # Mapped files can't be replaced on Windows
+        os.replace(self.path + ".tmp", self.path)
+        self.load()
+        return len(new)
+
+    def __reduce__(self):
+        # Workers map the file again, rather than being sent its contents
+        return CRCDictionary, (self.path,)
+
+
+def motion_crc_table(crc_cache: dict, args) -> dict | ChainMap:
+    """The table motions resolve their bindings through. With --crc-db, that's crc_cache and then
+    the persistent dictionary, which crc_cache is added to first"""
+    if not args.crc_db:
+        return crc_cache
+    crc_db = CRCDictionary(args.crc_db)
+    added = crc_db.update(crc_cache)
+    logger.info("CRC dictionary: %d entries, %d new" % (len(crc_db), added))
+    return ChainMap(crc_cache, crc_db)
+
+
+def clip_bindings(clip: AnimationClip) -> set[int]:
+    """CRC32s of the paths the curves of the clip bind to"""
+    if clip.m_Legacy:
+        return {crc32(curve.path.encode("utf-8")) for curve in clip.m_FloatCurves}
+    return {binding.path for binding in clip.m_ClipBindingConstant.genericBindings}
+
+
+def is_live2d_clip(clip: AnimationClip, crc_cache: dict) -> bool:
+    """Whether any curve of the clip binds to a known Part/Parameter path"""
+    return any(crc in crc_cache for crc in clip_bindings(clip))
+
+
+def motion3_segments(keys: list) -> tuple[list, int]:
+    """Encode the keyframes of a float curve into motion3 segments, as sssekai's to_motion3 does
+
+    The interpolation of each segment is worked out inline, rather than through
+    KeyframeHelper.interpolation_segment, which only matters for vector curves.
+
+    Returns:
+        tuple: Segments, and the number of points in them
+    """
+    inf = float("inf")
+    segments, points = [0, keys[0].value], 0
+    for lhs, rhs in zip(keys, keys[1:]):
+        if lhs.isDense:
+            segments += (0, rhs.time, rhs.value)
+        elif lhs.isConstant or lhs.outSlope == inf or rhs.inSlope == inf:
+            segments += (2, rhs.time, rhs.value)
+        else:
+            # [Bezier, P1 time, P1 value, P2 time, P2 value, Time, Value]
+            dx = (rhs.time - lhs.time) / 3
+            segments += (1, lhs.time + dx, lhs.outSlope * dx + lhs.value)
+            segments += (rhs.time - dx, rhs.value - rhs.inSlope * dx)
+            segments += (rhs.time, rhs.value)
+            points += 2
+        points += 1
+    return segments, points
+
+
+def build_motion3(
+    helper: AnimationHelper, crc_table: dict, clip: AnimationClip
+) -> dict:
+    """to_motion3 with the curves encoded by motion3_segments, producing the same motion3"""
+    curves = list(helper.FloatCurves)
+    meta = {
+        "Name": helper.Name,
+        "Duration": helper.Duration,
+        "Fps": helper.SampleRate,
+        "Loop": True,
+        "AreBeziersRestricted": True,
+        "CurveCount": len(curves),
+        "UserDataCount": 0,
+        "TotalPointCount": 0,
+        "TotalSegmentCount": 0,
+        "TotalUserDataSize": 0,
+    }
+    motion = {"Version": 3, "Meta": meta, "Curves": [], "UserData": []}
+    for curve in curves:
+        segments, points = motion3_segments(curve.Data)
+        meta["TotalPointCount"] += points
+        meta["TotalSegmentCount"] += len(curve.Data) - 1
+        path = curve.Path
+        if path in crc_table:
+            target, id = crc_table[path].split("/")
+            target = {"Parameters": "Parameter", "Parts": "PartOpacity"}.get(
+                target, target
+            )
+        else:
+            logger.warning("Failed to bind path CRC %s to any Live2D path" % path)
+            target, id = "PartOpacity", str(path)
+        motion["Curves"].append({"Target": target, "Id": id, "Segments": segments})
+    for event in clip.m_Events:
+        motion["UserData"].append({"time": event.time, "value": event.data})
+        meta["UserDataCount"] += 1
+        meta["TotalUserDataSize"] += len(event.data)
+    return motion
+
+
+def export_motion(reader: ObjectReader, crc_cache: dict, outdir: str) -> str | None:
+    """Convert the AnimationClip to motion3
+
+    Returns:
+        str: Path of the motion written relative to outdir, or None if the clip is not a Live2D one
+    """
+    timer = PROFILE.timer()
+    clip = reader.read()
+    timer.lap("motion_read", 1, reader.byte_size)
+    if not FLAGS.all_anim and not is_live2d_clip(clip, crc_cache):
+        logger.debug(f"[motion3]: Skipping {clip.m_Name}, not a Live2D motion")
+        return None
+    helper = AnimationHelper.from_clip(clip)
+    motion3 = build_motion3(helper, crc_cache, clip)
+    timer.lap("motion_convert", 1)
+    path = f"Animation/{clip.m_Name}.motion3.json"
+    logger.info(f"[motion3]: {path}")
+    size = OUTPUT.write(os.path.join(outdir, path), dump_json(motion3))
+    timer.lap("motion_encode", 1, size)
+    return path
+
+
+def worker_init(flags: ExtractorFlags, log_level: str):
+    """Process pool initializer. Carries the parent's flags and logging over to the worker"""
+    global FLAGS
+    FLAGS = flags
+    OBJECT_CACHE.maxsize = flags.object_cache
+    PROFILE.enabled = flags.profile
+    PROFILE.take()  # Forked workers start out with a copy of the parent's
+    uttcgen_runtime.UTTCG_NUMPY_ARRAYS = flags.numpy_arrays
+    setup_output(flags)
+    setup_logging(log_level)
+
+
+# CRC32 -> Part/Parameter path table of every model, in motion workers
+CRC_TABLE = dict()
+# The input file a motion worker has open, as (path, Environment)
+WORKER_INPUT = (None, None)
+# Clips per motion worker task
+MOTION_CHUNK = 64
+
+
+def motion_worker_init(flags: ExtractorFlags, log_level: str, crc_cache: dict):
+    """worker_init, and the CRC table shipped once per worker"""
+    global CRC_TABLE
+    worker_init(flags, log_level)
+    CRC_TABLE = crc_cache
+
+
+def export_motions_worker(
+    root: str, path: str, clips: list[tuple[str, int]], outdir: str
+) -> list[str]:
+    """Export the (cab, path_id) AnimationClips of the input file at `path`
+
+    The file stays open for the next chunk of clips from it, which is likely to follow.
+
+    Returns:
+        list: What export_motion returned for each clip
+    """
+    global WORKER_INPUT
+    if WORKER_INPUT[0] != path:
+        WORKER_INPUT = None, None
+        gc.collect()
+        WORKER_INPUT = path, open_input(root, path)
+    env = WORKER_INPUT[1]
+    motions = [
+        export_motion(env.get_cab(cab).objects[path_id], CRC_TABLE, outdir)
+        for cab, path_id in clips
+    ]
+    OUTPUT.flush()
+    return motions
+
+
+def export_motions(
+    root: str, clips: dict[str, list[tuple[str, int]]], crc_cache: dict, args
+) -> dict[str, list[str]]:
+    """Export AnimationClips, given as input file path -> (cab, path_id) list, with args.jobs processes
+
+    Returns:
+        dict: Input file path -> what export_motion returned for each of its clips
+    """
+    motions = {path: list() for path in clips}
+    with ProcessPoolExecutor(
+        args.jobs,
+        initializer=motion_worker_init,
+        initargs=(FLAGS, args.log_level, crc_cache),
+    ) as pool:
+        futures = {
+            pool.submit(
+                profiled,
+                export_motions_worker,
+                root,
+                path,
+                objects[i : i + MOTION_CHUNK],
+                args.outdir,
+            ): path
+            for path, objects in clips.items()
+            for i in range(0, len(objects), MOTION_CHUNK)
+        }
+        for future in as_completed(futures):
+            motions[futures[future]] += profiled_result(future)
+    return motions
+
+
+def written_motions(motions: dict[str, list]) -> dict[str, list[str]]:
+    """Drop the clips export_motion skipped from input file path -> motions, logging the counts"""
+    written = {path: [m for m in paths if m] for path, paths in motions.items()}
+    count = sum(map(len, written.values()))
+    logger.info(
+        "Motions: %d written, %d skipped as not Live2D"
+        % (count, sum(map(len, motions.values())) - count)
+    )
+    return written
+
+
+def export_models_worker(
+    root: str, path: str, objects: list[tuple[str, int]], outdir: str, claims: dict
+) -> tuple[dict, list]:
+    """Reopen the input file at `path` and export the models rooted at (cab, path_id) GameObjects
+
+    Dependencies are loaded on demand from `root`. Textures are claimed through the shared `claims`.
+
+    Returns:
+        tuple: Merged CRC32 -> Part/Parameter path table of the models, and the texture links to be made
+    """
+    env = open_input(root, path)
+    textures = TexturePipeline(FLAGS.texture_jobs, claims)
+    crc_cache = dict()
+    for cab, path_id in objects:
+        OBJ = read_from(env.get_cab(cab).objects[path_id])
+        crc_cache.update(export_model(OBJ, outdir, textures))
+    OBJECT_CACHE.clear()
+    OBJECT_CACHE.log_stats(logging.DEBUG)
+    return crc_cache, textures.finish()
+
+
+def export_input_models_worker(
+    root: str, path: str, outdir: str, claims: dict
+) -> tuple[dict, list]:
+    """export_input_models in a worker process, see export_models_worker"""
+    textures = TexturePipeline(FLAGS.texture_jobs, claims)
+    record = export_input_models(root, path, outdir, textures)
+    OBJECT_CACHE.log_stats(logging.DEBUG)
+    return record, textures.finish()
+
+
+INDEX_VERSION = 1
+
+
+def index_input(root: str, path: str) -> dict:
+    """Open the input file at `path` alone and list the models and AnimationClips in it
+
+    Returns:
+        dict: The file's entry in the index, see build_index. Models carry their CRC32 -> Part/Parameter
+        table ("crc") and clips their bindings ("bindings") until build_index matches them up
+    """
+    env = open_input(root, path)
+    objects = env.objects
+    entry = {"models": list(), "clips": list(), "bindings": list()}
+    for reader in discover(objects, EXPORTED_CLASSES):
+        MOC: CubismModel = read_from(reader)
+        OBJ: GameObject = read_from_ptr(MOC.m_GameObject, reader)
+        obj_reader = OBJ.object_reader
+        textures = set()
+        for child in children_recursive(OBJ):
+            for ptr in child.m_Components:
+                RND = read_from_ptr(ptr, child)
+                if isinstance(RND, CubismRenderer):
+                    tex = RND._mainTexture.deref(RND.object_reader.assets_file)
+                    textures.add((tex.assets_file.name, tex.path_id))
+        crc = set()
+        try:
+            moc = read_moc_bytes(MOC._moc.deref(reader.assets_file))
+            parts, parameters = read_moc3_ids(moc)
+            names = ["Parts/" + s for s in parts] + [
+                "Parameters/" + s for s in parameters
+            ]
+            crc = {crc32(name.encode("utf-8")) for name in names}
+        except Exception as e:
+            logger.warning("Failed to parse MOC3 of %s: %s" % (OBJ.m_Name, e))
+        entry["models"].append(
+            {
+                "name": OBJ.m_Name,
+                "container": container_path(obj_reader),
+                "object": [obj_reader.assets_file.name, obj_reader.path_id],
+                "model": [reader.assets_file.name, reader.path_id],
+                "textures": sorted(map(list, textures)),
+                "crc": sorted(crc),
+            }
+        )
+        logger.info("[index]: %s" % OBJ.m_Name)
+    for reader in objects:
+        if reader.type == ClassIDType.AnimationClip:
+            clip = reader.read()
+            entry["clips"].append(
+                [reader.assets_file.name, reader.path_id, clip.m_Name]
+            )
+            entry["bindings"].append(sorted(clip_bindings(clip)))
+    OBJECT_CACHE.clear()
+    entry["deps"] = sorted(
+        os.path.relpath(dep, root)
+        for dep in env.files
+        if dep != path and isinstance(dep, str) and os.path.isfile(dep)
+    )
+    entry["stat"] = file_stat(path)
+    return entry
+
+
+def build_index(root: str, entries: dict[str, dict]) -> dict:
+    """Build the index from input file (relative to root) -> what index_input returned for it
+
+    Every file is listed with its "stat" (see file_stat) and "deps". Files with models list them in "models",
+    each with its name, container path, (cab, path_id) of its GameObject ("object") and CubismModel ("model"),
+    the (cab, path_id) of its textures and the (file, cab, path_id) of the clips that bind to any of its Part/Parameter paths ("motions").
+    Files with AnimationClips list them as (cab, path_id, name) in "clips". The absolute root is kept in "root",
+    and the "stat" of dependencies that aren't indexed themselves in "deps".
+    """
+    by_crc = defaultdict(list)
+    for rel, entry in entries.items():
+        for (cab, path_id, _), bindings in zip(entry["clips"], entry.pop("bindings")):
+            for crc in bindings:
+                by_crc[crc].append((rel, cab, path_id))
+    for entry in entries.values():
+        for model in entry["models"]:
+            motions = {clip for crc in model.pop("crc") for clip in by_crc.get(crc, ())}
+            model["motions"] = sorted(map(list, motions))
+    # Dependencies outside of the indexed files, i.e. when a single file is indexed
+    deps = {
+        dep: file_stat(os.path.join(root, dep))
+        for entry in entries.values()
+        for dep in entry["deps"]
+        if dep not in entries
+    }
+    return {
+        "version": INDEX_VERSION,
+        "root": os.path.abspath(root),
+        "files": entries,
+        "deps": deps,
+    }
+
+
+def load_index(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+    if index.get("version") != INDEX_VERSION:
+        raise ValueError("Unsupported index version %s" % index.get("version"))
+    return index
+
+
+def select_models(index: dict) -> list[tuple[str, dict]]:
+    """(input file, model) of every indexed model that passes --include/--exclude"""
+    return [
+        (rel, model)
+        for rel, entry in index["files"].items()
+        for model in entry["models"]
+        if model_matches(model["name"], model["container"])
+    ]
+
+
+def __main_index__(argv: list[str]):
+    """Scan every input file once and write an index of the models and clips in them"""
+    parser = argparse.ArgumentParser(
+        prog="UnityPyLive2DExtractor index",
+        description="Index the Live2D models of a game install, for extract --from-index",
+    )
+    parser.add_argument("infile", help="Input file/directory to index")
+    parser.add_argument("index", help="Index file to write")
+    parser.add_argument(
+        "--log-level",
+        help="Set logging level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+    )
+    parser.add_argument(
+        "--jobs",
+        help="Index input files with N worker processes",
+        type=int,
+        default=1,
+    )
+    args = parser.parse_args(argv)
+    setup_logging(args.log_level)
+    root, paths = input_files(args.infile)
+    logger.info("Indexing %d files from %s" % (len(paths), root))
+    entries = dict()
+    if args.jobs > 1:
+        with ProcessPoolExecutor(
+            args.jobs, initializer=worker_init, initargs=(FLAGS, args.log_level)
+        ) as pool:
+            futures = {pool.submit(index_input, root, path): path for path in paths}
+            for future in as_completed(futures):
+                entries[futures[future]] = future.result()
+    else:
+        for path in paths:
+            logger.debug("Loading %s" % path)
+            entries[path] = index_input(root, path)
+            gc.collect()
+    index = build_index(
+        root, {os.path.relpath(path, root): entries[path] for path in paths}
+    )
+    logger.info(
+        "Index: %d models, %d clips"
+        % (
+            sum(len(entry["models"]) for entry in index["files"].values()),
+            sum(len(entry["clips"]) for entry in index["files"].values()),
+        )
+    )
+    with open(args.index + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+    os.replace(args.index + ".tmp", args.index)
+
+
+def __main_from_index__(args):
+    """Extract the selected models straight from the input files the index has them in"""
+    index = load_index(args.from_index)
+    # Files are indexed relative to the same root, see __main_index__
+    root, _ = input_files(args.infile)
+    if index.get("root") not in (None, os.path.abspath(root)):
+        logger.warning(
+            "Indexed from %s, extracting from %s"
+            % (index["root"], os.path.abspath(root))
+        )
+    models = select_models(index)
+    logger.info("Index: %d models selected" % len(models))
+    groups = defaultdict(list)
+    for rel, model in models:
+        groups[rel].append(tuple(model["object"]))
+    # Only the listed path_ids are looked up, which are meaningless once a file has changed
+    files = index["files"]
+    needed = {dep for rel in groups for dep in [rel] + files[rel]["deps"]}
+    clip_files = list()
+    if not args.no_anim:
+        if FLAGS.include or FLAGS.exclude:
+            motions = sorted(
+                {tuple(m) for _, model in models for m in model["motions"]}
+            )
+            clip_files = list(dict.fromkeys(rel for rel, _, _ in motions))
+        else:
+            motions = [
+                (rel, cab, path_id)
+                for rel in files
+                for cab, path_id, _ in files[rel]["clips"]
+            ]
+            clip_files = [rel for rel in files if files[rel]["clips"]]
+        needed.update(clip_files)
+    stale = sorted(
+        rel
+        for rel in needed
+        if not file_matches(
+            files[rel]["stat"] if rel in files else index.get("deps", {}).get(rel),
+            os.path.join(root, rel),
+        )
+    )
+    if stale:
+        for rel in stale:
+            logger.error("Changed since it was indexed: %s" % rel)
+        logger.error("The index is out of date, run index again")
+        sys.exit(1)
+    crc_cache = dict()
+    links = list()
+    if args.jobs > 1:
+        with (
+            multiprocessing.Manager() as manager,
+            ProcessPoolExecutor(
+                args.jobs, initializer=worker_init, initargs=(FLAGS, args.log_level)
+            ) as pool,
+        ):
+            claims = manager.dict()
+            futures = [
+                pool.submit(
+                    profiled,
+                    export_models_worker,
+                    root,
+                    os.path.join(root, rel),
+                    objects,
+                    args.outdir,
+                    claims,
+                )
+                for rel, objects in groups.items()
+            ]
+            for future in as_completed(futures):
+                crcs, worker_links = profiled_result(future)
+                crc_cache.update(crcs)
+                links += worker_links
+    else:
+        claims = dict()
+        for rel, objects in groups.items():
+            logger.debug("Loading %s" % rel)
+            crcs, file_links = export_models_worker(
+                root, os.path.join(root, rel), objects, args.outdir, claims
+            )
+            crc_cache.update(crcs)
+            links += file_links
+            gc.collect()
+    for src, dst in links:
+        OUTPUT.link(src, dst)
+    if links:
+        logger.info("Textures: %d shared copies linked" % len(links))
+    crc_cache = motion_crc_table(crc_cache, args)
+    if not args.no_anim:
+        clips = {os.path.join(root, rel): list() for rel in clip_files}
+        if FLAGS.all_anim:
+            for rel in clip_files:
+                clips[os.path.join(root, rel)] += [
+                    (cab, path_id) for cab, path_id, _ in files[rel]["clips"]
+                ]
+        else:
+            for rel, cab, path_id in motions:
+                clips[os.path.join(root, rel)].append((cab, path_id))
+        if args.jobs > 1:
+            motions = export_motions(root, clips, crc_cache, args)
+        else:
+            motions = dict()
+            for path, objects in clips.items():
+                logger.debug("Loading %s" % path)
+                env = open_input(root, path)
+                motions[path] = [
+                    export_motion(
+                        env.get_cab(cab).objects[path_id], crc_cache, args.outdir
+                    )
+                    for cab, path_id in objects
+                ]
+                del env
+                gc.collect()
+        written_motions(motions)
+    OUTPUT.flush()
+
+
 def __main__():
+    multiprocessing.freeze_support()
+    argv = sys.argv[1:]
+    if argv[:1] == ["index"]:
+        __main_index__(argv[1:])
+        return
+    if argv[:1] == ["extract"]:
+        argv = argv[1:]
     parser = argparse.ArgumentParser(
-        description="UnityPyLive2D Extractor v%d.%d.%d" % __version__
+        prog="UnityPyLive2DExtractor [extract]",
+        description="UnityPyLive2D Extractor v%d.%d.%d" % __version__,
+        epilog="See UnityPyLive2DExtractor index -h for indexing a game install beforehand",
     )
     parser.add_argument("infile", help="Input file/directory to extract from")
     parser.add_argument("outdir", help="Output directory to extract to")
@@ -204,115 +2170,461 @@ def __main__():
     parser.add_argument(
         "--no-anim", help="Do not extract animations", action="store_true"
     )
-    args = parser.parse_args()
-    coloredlogs.install(
-        level=args.log_level,
-        fmt="%(asctime)s %(name)s [%(levelname).4s] %(message)s",
-        isatty=True,
+    parser.add_argument(
+        "--crc-db",
+        help="Persistent CRC32 -> Part/Parameter path dictionary, created if it doesn't exist. "
+        "The paths of every model exported are added to it, and motions resolve through it as well, "
+        "so clips can be converted without their models in the input",
+    )
+    parser.add_argument(
+        "--all-anim",
+        help="Extract every animation, including those that bind to no Live2D Part/Parameter",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--jobs",
+        help="Export models and motions with N worker processes",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--texture-jobs",
+        help="Decode and write textures with N threads per process",
+        type=int,
+        default=FLAGS.texture_jobs,
+    )
+    parser.add_argument(
+        "--object-cache",
+        help="Keep up to N decoded objects per process for reuse across lookups, 0 to disable",
+        type=int,
+        default=FLAGS.object_cache,
     )
+    parser.add_argument(
+        "--stream",
+        help="Open input files one at a time instead of loading all of them at once",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--incremental",
+        help="Skip input files that are unchanged since the last run into outdir. Implies --stream",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--no-mmap",
+        help="Read input files into memory instead of mapping them",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--from-index",
+        help="Extract from the input files an index made with the index command has the models in, "
+        "instead of scanning all of them",
+    )
+    parser.add_argument(
+        "--include",
+        help="Only extract models whose GameObject name or container path matches this pattern, "
+        "and the motions that bind to any Part/Parameter ID of them. Those IDs (e.g. ParamAngleX) are "
+        "often shared by every model, so most Live2D motions are usually kept. Patterns are "
+        "case-insensitive globs, or regular expressions when prefixed with re:. Can be given multiple times",
+        action="append",
+        default=[],
+    )
+    parser.add_argument(
+        "--exclude",
+        help="Skip models whose GameObject name or container path matches this pattern, "
+        "see --include. Can be given multiple times",
+        action="append",
+        default=[],
+    )
+    parser.add_argument(
+        "--write-jobs",
+        help="Write output files with N background threads per process, 0 to write them right away",
+        type=int,
+        default=FLAGS.write_jobs,
+    )
+    parser.add_argument(
+        "--write-buffer",
+        help="Queue up to N MiB of output per process before waiting for the writes to catch up",
+        type=int,
+        default=FLAGS.write_buffer,
+    )
+    parser.add_argument(
+        "--fsync",
+        help="Sync output files to disk as each is written, or all at once when done",
+        default=FLAGS.fsync,
+        choices=["never", "each", "flush"],
+    )
+    parser.add_argument(
+        "--archive",
+        help="Write the output into archives in outdir instead of files",
+        choices=["zip", "tar"],
+    )
+    parser.add_argument(
+        "--archive-per",
+        help="With --archive, write one archive for the whole run (named after infile), "
+        "or one per model and one for the motions",
+        default="run",
+        choices=["run", "model"],
+    )
+    parser.add_argument(
+        "--json-compact",
+        help="Write physics3, model3 and motion3 JSON without indentation",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--json-encoder",
+        help="Encoder for --json-compact. auto uses orjson if it's installed",
+        default=FLAGS.json_encoder,
+        choices=["auto", *JSON_ENCODERS],
+    )
+    parser.add_argument(
+        "--profile",
+        help="Write a JSON report of the calls, wall/CPU time, objects and bytes of every stage, "
+        "in total and per model, to this file",
+    )
+    parser.add_argument(
+        "--profile-cprofile",
+        help="With --profile, also run the main process under cProfile and dump its stats to this file",
+    )
+    parser.add_argument(
+        "--profile-tracemalloc",
+        help="With --profile, also trace the main process' allocations and report the N largest sites",
+        type=int,
+        default=0,
+    )
+    parser.add_argument(
+        "--numpy-arrays",
+        help="Decode long (32 items or more) primitive array fields of the Live2D types into NumPy arrays "
+        "over the loaded data, instead of lists. Only applies to the types read by compiled readers, and "
+        "has no effect on those read with read_typetree, such as CubismFadeMotionData. Requires numpy",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--texture-format",
+        help="Write textures as PNG, or their image data in its original GPU format: as-is bare (raw) "
+        "or in a KTX2 container, or flipped top-down in a DDS one. Textures the container can't hold (e.g. ASTC in DDS, crunched "
+        "or swizzled ones) are still written as PNG",
+        default=FLAGS.texture_format,
+        choices=["png", "raw", "ktx2", "dds"],
+    )
+    args = parser.parse_args(argv)
+    if args.numpy_arrays and np is None:
+        parser.error("--numpy-arrays requires numpy")
+    if args.crc_db:
+        try:
+            CRCDictionary(args.crc_db).close()
+        except (OSError, ValueError) as e:
+            parser.error("--crc-db: %s" % e)
+    if (args.profile_cprofile or args.profile_tracemalloc) and not args.profile:
+        parser.error("--profile-cprofile and --profile-tracemalloc require --profile")
+    if (
+        args.json_encoder not in ("auto", "json")
+        and not JSON_ENCODERS[args.json_encoder]
+    ):
+        parser.error("--json-encoder %s is not installed" % args.json_encoder)
+    if args.from_index and args.incremental:
+        parser.error("--from-index can't be combined with --incremental")
+    if args.archive and (args.jobs > 1 or args.incremental):
+        parser.error("--archive can't be combined with --jobs or --incremental")
+    FLAGS.texture_jobs = args.texture_jobs
+    FLAGS.all_anim = args.all_anim
+    FLAGS.mmap = not args.no_mmap
+    FLAGS.include, FLAGS.exclude = args.include, args.exclude
+    FLAGS.object_cache = OBJECT_CACHE.maxsize = args.object_cache
+    FLAGS.write_jobs = args.write_jobs
+    FLAGS.write_buffer = args.write_buffer
+    FLAGS.fsync = args.fsync
+    FLAGS.json_compact = args.json_compact
+    FLAGS.json_encoder = args.json_encoder
+    FLAGS.numpy_arrays = uttcgen_runtime.UTTCG_NUMPY_ARRAYS = args.numpy_arrays
+    FLAGS.texture_format = args.texture_format
+    setup_output(FLAGS)
+    if args.archive:
+        OUTPUT.backend = ArchiveOutput(
+            args.outdir,
+            os.path.basename(os.path.abspath(args.infile)),
+            args.archive,
+            args.archive_per == "model",
+        )
+    FLAGS.profile = PROFILE.enabled = bool(args.profile)
+    setup_logging(args.log_level)
     os.makedirs(args.outdir, exist_ok=True)
     logger.info("UnityPyLive2D Extractor v%d.%d.%d" % __version__)
+    with profiling(args):
+        if args.from_index:
+            __main_from_index__(args)
+        elif args.stream or args.incremental:
+            __main_stream__(args)
+        else:
+            __main_load__(args)
+
+
+@contextmanager
+def profiling(args):
+    """Write the --profile report once the run is done, along with the cProfile/tracemalloc dumps if asked"""
+    if not args.profile:
+        yield
+        return
+    wall, cpu = time.perf_counter(), time.process_time()
+    if args.profile_tracemalloc:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if args.profile_cprofile else None
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile_cprofile)
+        report = {
+            "version": 1,
+            "argv": sys.argv[1:],
+            "wall": time.perf_counter() - wall,
+            "cpu": time.process_time() - cpu,
+            **PROFILE.take(),
+        }
+        try:
+            import resource
+
+            # KiB on Linux, bytes on macOS
+            scale = 1024 if sys.platform == "darwin" else 1
+            report["max_rss_kib"] = {
+                "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale,
+                "workers": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+                // scale,
+            }
+        except ImportError:  # Windows
+            pass
+        if args.profile_tracemalloc:
+            current, peak = tracemalloc.get_traced_memory()
+            top = tracemalloc.take_snapshot().statistics("lineno")
+            report["tracemalloc"] = {
+                "current": current,
+                "peak": peak,
+                "top": [
+                    {
+                        "where": str(stat.traceback),
+                        "size": stat.size,
+                        "count": stat.count,
+                    }
+                    for stat in top[: args.profile_tracemalloc]
+                ],
+            }
+            tracemalloc.stop()
+        with open(args.profile, "w") as f:
+            json.dump(report, f, indent=4)
+        logger.info("Profile: written to %s" % args.profile)
+
+
+def __main_load__(args):
+    """Load every input file at once and extract from all of them"""
     logger.info("Loading %s" % args.infile)
-    env = UnityPy.load(args.infile)
+    timer = PROFILE.timer()
+    env = load_input(args.infile)
+    timer.lap("load", len(env.files))
+    if args.jobs > 1 and not all(
+        os.path.isfile(os.path.join(env.path, path))
+        for path in set(source_files(env).values())
+    ):
+        # e.g. members of a .zip/.apk, which the workers can't open again by path
+        logger.warning(
+            "%s can't be reopened by workers, not using --jobs" % args.infile
+        )
+        args.jobs = 1
     objs = [
         read_from(reader)
-        for reader in filter(
-            lambda reader: reader.type == ClassIDType.MonoBehaviour,
-            env.objects,
-        )
-    ]
-    logger.info("MonoBehaviours: %d" % len(objs))
-    candidates = [
-        read_from_ptr(obj.m_GameObject, obj)
-        for obj in filter(lambda obj: isinstance(obj, CubismModel), objs)
+        for reader in discover(env.objects, EXPORTED_CLASSES)
+        if model_selected(reader)
     ]
+    timer.lap("discover", len(objs))
+    logger.info(
+        "MonoBehaviours: %d scripts, %d models" % (len(SCRIPT_CACHE), len(objs))
+    )
+    candidates = [read_from_ptr(obj.m_GameObject, obj) for obj in objs]
     crc_cache = dict()
-    # fmt: off
-    for OBJ in candidates:
-        OBJ: GameObject
-        components = [read_from_ptr(ptr, OBJ) for ptr in OBJ.m_Components]
-        NAME = OBJ.m_Name
-        MOC : CubismModel = next(filter(lambda x: isinstance(x, CubismModel), components), None)        
-        PHY : CubismPhysicsController = next(filter(lambda x: isinstance(x, CubismPhysicsController), components), None)
-        # ANI : Animator = next(filter(lambda x: isinstance(x, Animator), components), None)
-        # RND : CubismRenderController = next(filter(lambda x: isinstance(x, CubismRenderController), components), None)
-        logger.info(f"Processing {NAME}")
-        outdir = os.path.join(args.outdir, NAME)
-        os.makedirs(outdir, exist_ok=True)
-        metadata = {
-            "Version": 3,
-            "FileReferences": {
-                "Moc":"",
-                "Textures": [],
-                "Physics": ""
-            },
-        }
-        if MOC:
-            fname = metadata["FileReferences"]["Moc"] = f"{NAME}.moc3"
-            with open(os.path.join(outdir, fname), "wb") as f:
-                moc = read_from_ptr(MOC._moc, MOC.object_reader)
-                moc = bytes(moc._bytes)
-                logger.info(".moc3: %d bytes" % f.write(moc))
-                try:
-                    parts, parameters = read_moc3(io.BytesIO(moc))
-                    for s in parts:
-                        path = "Parts/" + s
-                        crc_cache[crc32(path.encode("utf-8"))] = path
-                    for s in parameters:
-                        path = "Parameters/" + s
-                        crc_cache[crc32(path.encode("utf-8"))] = path
-                    logger.info(".moc3: %d parts, %d parameters" % (len(parts), len(parameters)))
-                except Exception as e:
-                    logger.warning("Failed to parse MOC3: %s" % e)
-                    logger.warning("This may indicate obfuscation or a different format")
-        if PHY:
-            fname = metadata["FileReferences"]["Physics"] = f"{NAME}.physics3.json"
-            with open(os.path.join(outdir, fname), "w") as f:
-                logger.info(".physics3.json: %d bytes" % f.write(json.dumps(PHY.dump(),indent=4)))
-        # Renderers are bound to the meshes in the hierarchy
-        def children_recursive(obj: GameObject):
-            transform : Transform = obj.m_Transform.read()
-            for child in transform.m_Children:
-                child = read_from_ptr(child, obj)
-                ch_obj = child.m_GameObject.read()
-                yield ch_obj
-                yield from children_recursive(ch_obj)
-        # Mark referenced textures
-        TEX = set()
-        for child in children_recursive(OBJ):
-            components = [read_from_ptr(ptr, child) for ptr in child.m_Components]
-            RND : CubismRenderer = next(filter(lambda x: isinstance(x, CubismRenderer), components), None)
-            if RND:
-                TEX.add(RND)
-        if TEX:
-            metadata["FileReferences"]["Textures"] = []
-            for tex in TEX:
-                tex : CubismRenderer
-                tex : Texture2D = read_from_ptr(tex._mainTexture, tex)                
-                path = f"Textures/{tex.m_Name}.png"
-                metadata["FileReferences"]["Textures"].append(path)                
-                path = os.path.join(outdir, path)
-                os.makedirs(os.path.dirname(path), exist_ok=True)
-                tex.image.save(path)
-                logger.info(f"[texture]: {tex.m_Name}")
-            # XXX: Lexical. But why?
-            metadata["FileReferences"]["Textures"].sort()
-        path = f"{NAME}.model3.json"
-        json.dump(metadata, open(os.path.join(outdir,path), "w"), indent=4)
-        logger.info(f"[metadata]: {path}")
-    # fmt: on
+    links = list()
+    if args.jobs > 1:
+        # Models are grouped by the input file they came from. Each worker reopens one of them
+        sources = source_files(env)
+        groups = defaultdict(list)
+        for OBJ in candidates:
+            reader = OBJ.object_reader
+            groups[sources[id(reader.assets_file)]].append(
+                (reader.assets_file.name, reader.path_id)
+            )
+        logger.info(
+            "Exporting %d models from %d files with %d workers"
+            % (len(candidates), len(groups), args.jobs)
+        )
+        with (
+            multiprocessing.Manager() as manager,
+            ProcessPoolExecutor(
+                args.jobs, initializer=worker_init, initargs=(FLAGS, args.log_level)
+            ) as pool,
+        ):
+            claims = manager.dict()
+            futures = [
+                pool.submit(
+                    profiled,
+                    export_models_worker,
+                    env.path,
+                    path,
+                    objects,
+                    args.outdir,
+                    claims,
+                )
+                for path, objects in groups.items()
+            ]
+            for future in as_completed(futures):
+                crcs, worker_links = profiled_result(future)
+                crc_cache.update(crcs)
+                links += worker_links
+    else:
+        textures = TexturePipeline(FLAGS.texture_jobs)
+        for OBJ in candidates:
+            crc_cache.update(export_model(OBJ, args.outdir, textures))
+        links = textures.finish()
+        OBJECT_CACHE.log_stats()
+    for src, dst in links:
+        OUTPUT.link(src, dst)
+    if links:
+        logger.info("Textures: %d shared copies linked" % len(links))
+    crc_cache = motion_crc_table(crc_cache, args)
     if not args.no_anim:
-        for reader in filter(
+        clips = filter(
             lambda reader: reader.type == ClassIDType.AnimationClip, env.objects
+        )
+        if args.jobs > 1:
+            sources = source_files(env)
+            groups = defaultdict(list)
+            for reader in clips:
+                groups[sources[id(reader.assets_file)]].append(
+                    (reader.assets_file.name, reader.path_id)
+                )
+            written_motions(export_motions(env.path, groups, crc_cache, args))
+        else:
+            written_motions(
+                {env.path: [export_motion(r, crc_cache, args.outdir) for r in clips]}
+            )
+    OUTPUT.flush()
+
+
+def __main_stream__(args):
+    """Extract from one input file (and the dependencies it pulls in) at a time
+
+    Models go first, then the files with AnimationClips in them are opened again once
+    the CRC table is complete"""
+    root, paths = input_files(args.infile)
+    logger.info("Streaming %d files from %s" % (len(paths), root))
+    manifest = None
+    if args.incremental:
+        manifest = Manifest(
+            args.outdir,
+            root,
+            {
+                "no_anim": args.no_anim,
+                "all_anim": args.all_anim,
+                "json_compact": args.json_compact,
+                "texture_format": args.texture_format,
+                "include": args.include,
+                "exclude": args.exclude,
+            },
+        )
+    todo = paths
+    claims = dict()
+    if manifest:
+        todo = [path for path in paths if not manifest.unchanged(path)]
+        logger.info("Manifest: %d of %d files changed" % (len(todo), len(paths)))
+        previous_crc_table = manifest.crc_table()
+        manifest.prune(paths)
+        claims = manifest.claims(todo)
+    records = dict()
+    if args.jobs > 1:
+        with (
+            multiprocessing.Manager() as manager,
+            ProcessPoolExecutor(
+                args.jobs, initializer=worker_init, initargs=(FLAGS, args.log_level)
+            ) as pool,
         ):
-            clip = reader.read()
-            helper = AnimationHelper.from_clip(clip)
-            motion3 = to_motion3(helper, crc_cache, clip)
-            path = f"Animation/{clip.m_Name}.motion3.json"
-            logger.info(f"[motion3]: {path}")
-            path = os.path.join(args.outdir, path)
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            json.dump(motion3, open(path, "w"), indent=4)
+            claims = manager.dict(claims)
+            futures = {
+                pool.submit(
+                    profiled,
+                    export_input_models_worker,
+                    root,
+                    path,
+                    args.outdir,
+                    claims,
+                ): path
+                for path in todo
+            }
+            links = list()
+            for future in as_completed(futures):
+                records[futures[future]], worker_links = profiled_result(future)
+                links += worker_links
+    else:
+        textures = TexturePipeline(FLAGS.texture_jobs, claims)
+        for path in todo:
+            logger.debug("Loading %s" % path)
+            records[path] = export_input_models(root, path, args.outdir, textures)
+            # UnityPy's files and readers reference each other, collect them before moving on
+            gc.collect()
+        links = textures.finish()
+        OBJECT_CACHE.log_stats()
+    for src, dst in links:
+        OUTPUT.link(src, dst)
+    if links:
+        logger.info("Textures: %d shared copies linked" % len(links))
+    clip_files = [path for path in todo if records[path]["clips"]]
+    if manifest:
+        for path in todo:
+            manifest.update(path, records[path])
+        crc_cache = manifest.crc_table()
+        # Any clip may bind to the Parts/Parameters that came or went
+        redo = crc_cache != previous_crc_table
+    else:
+        crc_cache = dict()
+        for path in paths:
+            crc_cache.update({int(k): v for k, v in records[path]["crc"].items()})
+    crc_cache = motion_crc_table(crc_cache, args)
+    if manifest:
+        # ...or to those the dictionary gained since, in this run or any other. Entries are
+        # only ever added to it, so it has changed when their number has
+        crc_db = len(crc_cache.maps[1]) if args.crc_db else None
+        redo |= crc_db != manifest.crc_db
+        manifest.crc_db = crc_db
+        if redo:
+            clip_files = [
+                path
+                for path in paths
+                if manifest.records[os.path.relpath(path, root)]["clips"]
+            ]
+    if not args.no_anim:
+        motions = dict()
+        for path in clip_files:
+            logger.debug("Loading %s" % path)
+            env = open_input(root, path)
+            clips = [r for r in env.objects if r.type == ClassIDType.AnimationClip]
+            if args.jobs > 1:
+                # Only listed here, the workers open the file again
+                motions[path] = [(r.assets_file.name, r.path_id) for r in clips]
+            else:
+                motions[path] = [
+                    export_motion(r, crc_cache, args.outdir) for r in clips
+                ]
+            del env, clips
+            gc.collect()
+        if args.jobs > 1:
+            motions = export_motions(root, motions, crc_cache, args)
+        motions = written_motions(motions)
+        for path in motions if manifest else ():
+            rel = os.path.relpath(path, root)
+            record = manifest.records[rel]
+            manifest.remove_stale(rel, {**record, "motions": motions[path]})
+            record["motions"] = motions[path]
+    OUTPUT.flush()
+    if manifest:
+        manifest.save()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+# Regenerates index.py, the full name -> module index used by UTTCGen_GetClass,
+# and typetrees.pickle, the precompiled typetree store used by UTTCGen_Node
+# Run this after replacing the generated types: python -m UnityPyLive2DExtractor.generated
+import argparse, os, json, pickle
+from importlib import import_module
+from ..uttcgen_runtime import UTTCG_Classes, UTTCG_STORE_PATH
+
+PACKAGE_PATH = os.path.dirname(__file__)
+TYPETREE_PATH = os.path.join(
+    PACKAGE_PATH, "..", "..", "external", "typetree_cubism.json"
+)
+
+
+def import_all():
+    # Namespaces are implicit (__init__-less) packages, which pkgutil won't walk into
+    for root, _, files in os.walk(PACKAGE_PATH):
+        for file in sorted(files):
+            name, ext = os.path.splitext(file)
+            if ext != ".py" or name in {"__main__", "index"}:
+                continue
+            module = os.path.relpath(os.path.join(root, name), PACKAGE_PATH)
+            module = module.split(os.sep)
+            if module[-1] == "__init__":
+                module.pop()
+            import_module(".".join([__package__] + module))
+
+
+def write_index():
+    index = dict()
+    for fullname, clazz in sorted(UTTCG_Classes.items()):
+        module = clazz.__module__[len(__package__) + 1 :]
+        index.setdefault(module, list()).append(fullname)
+    with open(os.path.join(PACKAGE_PATH, "index.py"), "w", encoding="utf-8") as f:
+        f.write("# fmt: off\n")
+        f.write("# Generated by python -m UnityPyLive2DExtractor.generated\n")
+        f.write(
+            "# Module (relative to UnityPyLive2DExtractor.generated) -> full names of the classes it defines\n"
+        )
+        f.write("UTTCG_Index = {\n")
+        for module in sorted(index):
+            f.write(f"    {module!r}: {tuple(index[module])!r},\n")
+        f.write("}\n")
+    print("index.py: %d classes in %d modules" % (len(UTTCG_Classes), len(index)))
+
+
+def write_store(typetree: dict):
+    """typetree: Full name -> node list, as in typetree_cubism.json"""
+    store = {
+        fullname: tuple(
+            (node["m_Level"], node["m_Type"], node["m_Name"], node["m_MetaFlag"])
+            for node in nodes
+        )
+        for fullname, nodes in sorted(typetree.items())
+    }
+    with open(UTTCG_STORE_PATH, "wb") as f:
+        pickle.dump(store, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print("%s: %d typetrees" % (os.path.basename(UTTCG_STORE_PATH), len(store)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rebuild the class index and the typetree store of the generated types"
+    )
+    parser.add_argument(
+        "--typetree",
+        help="Typetree dump to build the store from. Defaults to external/typetree_cubism.json, "
+        "or the typetrees of the generated classes if that's not around",
+        default=TYPETREE_PATH if os.path.exists(TYPETREE_PATH) else None,
+    )
+    args = parser.parse_args()
+    import_all()
+    write_index()
+    if args.typetree:
+        with open(args.typetree, "r", encoding="utf-8") as f:
+            write_store(json.load(f))
+    else:
+        write_store({k: v.__typetree__ for k, v in UTTCG_Classes.items()})
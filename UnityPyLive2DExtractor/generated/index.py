@@ -0,0 +1,32 @@
+# fmt: off
+# Generated by python -m UnityPyLive2DExtractor.generated
+# Module (relative to UnityPyLive2DExtractor.generated) -> full names of the classes it defines
+UTTCG_Index = {
+    'Live2D.Cubism.Core': ('Live2D.Cubism.Core.ArrayExtensionMethods', 'Live2D.Cubism.Core.ComponentExtensionMethods', 'Live2D.Cubism.Core.CubismCanvasInformation', 'Live2D.Cubism.Core.CubismDrawable', 'Live2D.Cubism.Core.CubismDynamicDrawableData', 'Live2D.Cubism.Core.CubismLogging', 'Live2D.Cubism.Core.CubismMoc', 'Live2D.Cubism.Core.CubismModel', 'Live2D.Cubism.Core.CubismParameter', 'Live2D.Cubism.Core.CubismPart', 'Live2D.Cubism.Core.CubismTaskQueue', 'Live2D.Cubism.Core.CubismTaskableModel', 'Live2D.Cubism.Core.GameObjectExtensionMethods', 'Live2D.Cubism.Core.ICubismTask'),
+    'Live2D.Cubism.Core.Unmanaged': ('Live2D.Cubism.Core.Unmanaged.ByteExtensionMethods', 'Live2D.Cubism.Core.Unmanaged.CubismCoreDll', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedByteArrayView', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedCanvasInformation', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedDrawables', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedFloatArrayView', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedIntArrayView', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedMemory', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedMoc', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedModel', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedParameters', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedParts', 'Live2D.Cubism.Core.Unmanaged.CubismUnmanagedUshortArrayView'),
+    'Live2D.Cubism.Framework': ('Live2D.Cubism.Framework.ComponentExtensionMethods', 'Live2D.Cubism.Framework.CubismAutoEyeBlinkInput', 'Live2D.Cubism.Framework.CubismDisplayInfoParameterName', 'Live2D.Cubism.Framework.CubismDisplayInfoPartName', 'Live2D.Cubism.Framework.CubismDontMoveOnReimportAttribute', 'Live2D.Cubism.Framework.CubismEyeBlinkController', 'Live2D.Cubism.Framework.CubismEyeBlinkParameter', 'Live2D.Cubism.Framework.CubismHitDrawable', 'Live2D.Cubism.Framework.CubismMoveOnReimportCopyComponentsOnly', 'Live2D.Cubism.Framework.CubismParameterBlendMode', 'Live2D.Cubism.Framework.CubismParameterExtensionMethods', 'Live2D.Cubism.Framework.CubismParameterStore', 'Live2D.Cubism.Framework.CubismParametersInspector', 'Live2D.Cubism.Framework.CubismPartsInspector', 'Live2D.Cubism.Framework.CubismUpdateController', 'Live2D.Cubism.Framework.CubismUpdateExecutionOrder', 'Live2D.Cubism.Framework.ICubismUpdatable', 'Live2D.Cubism.Framework.ObjectExtensionMethods'),
+    'Live2D.Cubism.Framework.Expression': ('Live2D.Cubism.Framework.Expression.CubismExpressionController', 'Live2D.Cubism.Framework.Expression.CubismExpressionData', 'Live2D.Cubism.Framework.Expression.CubismExpressionList', 'Live2D.Cubism.Framework.Expression.CubismExpressionParameterValue', 'Live2D.Cubism.Framework.Expression.CubismPlayingExpression'),
+    'Live2D.Cubism.Framework.HarmonicMotion': ('Live2D.Cubism.Framework.HarmonicMotion.CubismHarmonicMotionController', 'Live2D.Cubism.Framework.HarmonicMotion.CubismHarmonicMotionDirection', 'Live2D.Cubism.Framework.HarmonicMotion.CubismHarmonicMotionParameter'),
+    'Live2D.Cubism.Framework.Json': ('Live2D.Cubism.Framework.Json.CubismBuiltinPickers', 'Live2D.Cubism.Framework.Json.CubismDisplayInfo3Json', 'Live2D.Cubism.Framework.Json.CubismExp3Json', 'Live2D.Cubism.Framework.Json.CubismJsonParser', 'Live2D.Cubism.Framework.Json.CubismModel3Json', 'Live2D.Cubism.Framework.Json.CubismMotion3Json', 'Live2D.Cubism.Framework.Json.CubismPhysics3Json', 'Live2D.Cubism.Framework.Json.CubismPose3Json', 'Live2D.Cubism.Framework.Json.CubismUserData3Json', 'Live2D.Cubism.Framework.Json.Value'),
+    'Live2D.Cubism.Framework.LookAt': ('Live2D.Cubism.Framework.LookAt.CubismLookAxis', 'Live2D.Cubism.Framework.LookAt.CubismLookController', 'Live2D.Cubism.Framework.LookAt.CubismLookParameter', 'Live2D.Cubism.Framework.LookAt.CubismLookTargetBehaviour', 'Live2D.Cubism.Framework.LookAt.ICubismLookTarget'),
+    'Live2D.Cubism.Framework.Motion': ('Live2D.Cubism.Framework.Motion.CubismMotionController', 'Live2D.Cubism.Framework.Motion.CubismMotionLayer', 'Live2D.Cubism.Framework.Motion.CubismMotionPriority', 'Live2D.Cubism.Framework.Motion.CubismMotionState'),
+    'Live2D.Cubism.Framework.MotionFade': ('Live2D.Cubism.Framework.MotionFade.CubismFadeController', 'Live2D.Cubism.Framework.MotionFade.CubismFadeCurveType', 'Live2D.Cubism.Framework.MotionFade.CubismFadeMath', 'Live2D.Cubism.Framework.MotionFade.CubismFadeMotionData', 'Live2D.Cubism.Framework.MotionFade.CubismFadeMotionList', 'Live2D.Cubism.Framework.MotionFade.CubismFadePlayingMotion', 'Live2D.Cubism.Framework.MotionFade.CubismFadeStateObserver', 'Live2D.Cubism.Framework.MotionFade.ICubismFadeState'),
+    'Live2D.Cubism.Framework.MouthMovement': ('Live2D.Cubism.Framework.MouthMovement.CubismAudioMouthInput', 'Live2D.Cubism.Framework.MouthMovement.CubismAudioSamplingQuality', 'Live2D.Cubism.Framework.MouthMovement.CubismAutoMouthInput', 'Live2D.Cubism.Framework.MouthMovement.CubismMouthController', 'Live2D.Cubism.Framework.MouthMovement.CubismMouthParameter'),
+    'Live2D.Cubism.Framework.Physics': ('Live2D.Cubism.Framework.Physics.CubismPhysics', 'Live2D.Cubism.Framework.Physics.CubismPhysicsController', 'Live2D.Cubism.Framework.Physics.CubismPhysicsInput', 'Live2D.Cubism.Framework.Physics.CubismPhysicsMath', 'Live2D.Cubism.Framework.Physics.CubismPhysicsNormalization', 'Live2D.Cubism.Framework.Physics.CubismPhysicsNormalizationTuplet', 'Live2D.Cubism.Framework.Physics.CubismPhysicsOutput', 'Live2D.Cubism.Framework.Physics.CubismPhysicsParticle', 'Live2D.Cubism.Framework.Physics.CubismPhysicsRig', 'Live2D.Cubism.Framework.Physics.CubismPhysicsSourceComponent', 'Live2D.Cubism.Framework.Physics.CubismPhysicsSubRig'),
+    'Live2D.Cubism.Framework.Pose': ('Live2D.Cubism.Framework.Pose.CubismPoseController', 'Live2D.Cubism.Framework.Pose.CubismPoseData', 'Live2D.Cubism.Framework.Pose.CubismPosePart'),
+    'Live2D.Cubism.Framework.Raycasting': ('Live2D.Cubism.Framework.Raycasting.CubismRaycastHit', 'Live2D.Cubism.Framework.Raycasting.CubismRaycastable', 'Live2D.Cubism.Framework.Raycasting.CubismRaycastablePrecision', 'Live2D.Cubism.Framework.Raycasting.CubismRaycaster'),
+    'Live2D.Cubism.Framework.Tasking': ('Live2D.Cubism.Framework.Tasking.CubismBuiltinAsyncTaskHandler',),
+    'Live2D.Cubism.Framework.UserData': ('Live2D.Cubism.Framework.UserData.CubismUserDataBody', 'Live2D.Cubism.Framework.UserData.CubismUserDataTag', 'Live2D.Cubism.Framework.UserData.CubismUserDataTargetType'),
+    'Live2D.Cubism.Framework.Utils': ('Live2D.Cubism.Framework.Utils.CubismMath',),
+    'Live2D.Cubism.Garage': ('Live2D.Cubism.Garage.CheckMaskLimit', 'Live2D.Cubism.Garage.CubismCollisionDetection', 'Live2D.Cubism.Garage.CubismFollowing', 'Live2D.Cubism.Garage.CubismFollowingCollider', 'Live2D.Cubism.Garage.CubismSetTextures'),
+    'Live2D.Cubism.Rendering': ('Live2D.Cubism.Rendering.ArrayExtensionMethods', 'Live2D.Cubism.Rendering.CubismBuiltinMaterials', 'Live2D.Cubism.Rendering.CubismBuiltinShaders', 'Live2D.Cubism.Rendering.CubismRenderController', 'Live2D.Cubism.Rendering.CubismRenderer', 'Live2D.Cubism.Rendering.CubismShaderVariables', 'Live2D.Cubism.Rendering.CubismSortingMode', 'Live2D.Cubism.Rendering.CubismSortingModeExtensionMethods', 'Live2D.Cubism.Rendering.ICubismBlendColorHandler', 'Live2D.Cubism.Rendering.ICubismDrawOrderHandler', 'Live2D.Cubism.Rendering.ICubismOpacityHandler'),
+    'Live2D.Cubism.Rendering.Masking': ('Live2D.Cubism.Rendering.Masking.CubismMaskCommandBuffer', 'Live2D.Cubism.Rendering.Masking.CubismMaskController', 'Live2D.Cubism.Rendering.Masking.CubismMaskMaskedJunction', 'Live2D.Cubism.Rendering.Masking.CubismMaskProperties', 'Live2D.Cubism.Rendering.Masking.CubismMaskRenderer', 'Live2D.Cubism.Rendering.Masking.CubismMaskRendererExtensionMethods', 'Live2D.Cubism.Rendering.Masking.CubismMaskTexture', 'Live2D.Cubism.Rendering.Masking.CubismMaskTile', 'Live2D.Cubism.Rendering.Masking.CubismMaskTilePool', 'Live2D.Cubism.Rendering.Masking.CubismMaskTransform', 'Live2D.Cubism.Rendering.Masking.ICubismMaskCommandSource', 'Live2D.Cubism.Rendering.Masking.ICubismMaskTextureCommandSource', 'Live2D.Cubism.Rendering.Masking.IntExtensionMethods'),
+    'Live2D.Cubism.Samples.AsyncBenchmark': ('Live2D.Cubism.Samples.AsyncBenchmark.AsyncToggler', 'Live2D.Cubism.Samples.AsyncBenchmark.BenchmarkController', 'Live2D.Cubism.Samples.AsyncBenchmark.FpsCounter', 'Live2D.Cubism.Samples.AsyncBenchmark.FrameRateMeasurer', 'Live2D.Cubism.Samples.AsyncBenchmark.FrameRateUiHolder', 'Live2D.Cubism.Samples.AsyncBenchmark.ModelSpawner', 'Live2D.Cubism.Samples.AsyncBenchmark.TotalElapsedTime'),
+    'Live2D.Cubism.Samples.LookAt': ('Live2D.Cubism.Samples.LookAt.Billboarder',),
+    'Live2D.Cubism.Samples.Masking': ('Live2D.Cubism.Samples.Masking.MaskTexturePreview',),
+    'Live2D.Cubism.Samples.OriginalWorkflow.Demo': ('Live2D.Cubism.Samples.OriginalWorkflow.Demo.CubismLookTarget', 'Live2D.Cubism.Samples.OriginalWorkflow.Demo.CubismSampleController'),
+    'Live2D.Cubism.Samples.OriginalWorkflow.Expression': ('Live2D.Cubism.Samples.OriginalWorkflow.Expression.CubismExpressionPreview',),
+    'Live2D.Cubism.Samples.OriginalWorkflow.Motion': ('Live2D.Cubism.Samples.OriginalWorkflow.Motion.CubismMotionPreview',),
+    'Live2D.Cubism.Samples.Raycasting': ('Live2D.Cubism.Samples.Raycasting.RaycastHitDisplay',),
+    '_default': ('<>c', '<>c__DisplayClass16_0', '<>c__DisplayClass43_0', '<>c__DisplayClass44_0', '<Module>', '<PrivateImplementationDetails>', 'AllocationItem', 'CombinedParameter', 'CubismDisplayInfoCombinedParameterInfo', 'CubismTaskHandler', 'DynamicDrawableDataHandler', 'HitArea', 'HitDrawableInfomation', 'LayoutContext', 'LoadAssetAtPathHandler', 'MasksMaskedsPair', 'MasksMaskedsPairs', 'MaterialPicker', 'MonoScriptData', 'NormalizedParameterValueGetter', 'Phase', 'PhysicsDictionaryItem', 'ScaleGetter', 'SegmentParser', 'SerializableCombinedParameterIds', 'SerializableCurve', 'SerializableEffectiveForces', 'SerializableExpression', 'SerializableExpressionParameter', 'SerializableFileReferences', 'SerializableGroup', 'SerializableHitArea', 'SerializableInput', 'SerializableMeta', 'SerializableMotion', 'SerializableMotions', 'SerializableNormalization', 'SerializableNormalizationValue', 'SerializableOutput', 'SerializableParameter', 'SerializableParameterGroups', 'SerializableParameters', 'SerializableParts', 'SerializablePhysicsSettings', 'SerializablePoseGroup', 'SerializableUserData', 'SerializableVector2', 'SerializableVertex', 'SourcesItem', 'SubRigPhysicsOutput', 'SwapInfo', 'TaskState', 'TexturePicker', 'UnitySourceGeneratedAssemblyMonoScriptTypes_v1', 'UnmanagedLogDelegate', 'ValueGetter', '__StaticArrayInitTypeSize=10454', '__StaticArrayInitTypeSize=9233'),
+}
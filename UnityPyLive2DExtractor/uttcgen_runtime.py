@@ -0,0 +1,481 @@
+# fmt: off
+# Runtime of the generated typetree classes in .generated: the UTTCGen decorator, compiled constructors and
+# readers, and the class and typetree lookups. Kept out of generated/, which is replaced when regenerating.
+from typing import List, Union, Optional, TypeVar, Type
+from importlib import import_module
+from itertools import count
+from struct import Struct, calcsize, unpack_from, error as StructError
+from logging import getLogger
+import os, pickle
+from UnityPy.files.ObjectReader import ObjectReader
+from UnityPy.helpers.TypeTreeNode import TypeTreeNode
+from UnityPy.classes import *
+from UnityPy.classes.math import (ColorRGBA, Matrix3x4f, Matrix4x4f, Quaternionf, Vector2f, Vector3f, Vector4f, float3, float4,)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = getLogger(__name__)
+# The package of the generated classes
+UTTCG_PACKAGE = f"{__package__}.generated"
+UTTCG_Classes = dict()
+# Full name -> module (relative to this package) of every generated class, see UTTCGen_Resolve
+UTTCG_Modules = dict()
+# Full name -> (m_Level, m_Type, m_Name, m_MetaFlag) node tuples, see UTTCGen_Node
+UTTCG_Store = None
+UTTCG_STORE_PATH = os.path.join(os.path.dirname(__file__), "generated", "typetrees.pickle")
+# Full name -> built typetree
+UTTCG_Nodes = dict()
+REFERENCED_ARGS = {'object_reader'}
+PRIMITIVE_TYPES = {int, float, bool, str}
+def UTTCGen_FieldPlan(clazz) -> list:
+    """Flattened constructor plan of a UTTCGen class
+
+    Returns a list of (required keys, fields) groups, where each field is (name, type, element type, nested).
+    Base class groups are only applied when all of their required keys are present, the class' own group
+    (with required keys being None) is always applied. Order follows the original base-first reduction.
+    """
+    def reduce_fields(types : dict):
+        fields = []
+        for k, sub in types.items():
+            if type(sub) == str:
+                sub = eval(sub) # attrs turns these into strings...why?
+            while sub.__name__ == "Optional":
+                sub = sub.__args__[0]  # Reduce Optional[T] -> T
+            reduce_arg = getattr(sub, "__args__", [None])[0]
+            if k in REFERENCED_ARGS: # Directly refcounted
+                fields.append((k, None, None, False))
+                continue
+            nested = reduce_arg is not None and (hasattr(reduce_arg, "__annotations__") or hasattr(reduce_arg, "__args__"))
+            fields.append((k, sub, reduce_arg, nested))
+        return fields
+    plan = []
+    def reduce_base(clazz):
+        for __base__ in clazz.__bases__:
+            if hasattr(__base__, "__annotations__"):
+                types : dict = __base__.__annotations__
+                if types:
+                    plan.append((tuple(types), reduce_fields(types)))
+            reduce_base(__base__)
+    reduce_base(clazz)
+    plan.append((None, reduce_fields(clazz.__annotations__)))
+    return plan
+
+def UTTCGen_Compile(clazz):
+    """Generate a specialized __init__ for a UTTCGen class from its field plan"""
+    scope, lines = dict(), ["def __init__(self, **d):"]
+    def bind(value) -> str:
+        name = "_T%d" % len(scope)
+        scope[name] = value
+        return name
+    def convert(sub, reduce_arg, nested) -> str:
+        if sub is None:
+            return "v"
+        origin = sub.__origin__ if getattr(sub, "__origin__", None) is not None else sub
+        if origin in PRIMITIVE_TYPES:
+            scalar = f"{origin.__name__}(v)"
+        else:
+            O = bind(origin)
+            scalar = f"({O}(**v) if isinstance(v, dict) else {O}(v))"
+        if reduce_arg is None:
+            return scalar
+        A = bind(reduce_arg)
+        items = f"[{A}(**x) for x in v]" if nested else f"list(map({A}, v))"
+        mapping = f"{bind(sub)}(**v) if isinstance(v, dict) else " if hasattr(sub, "__annotations__") else ""
+        return f"({items} if isinstance(v, list) else {mapping}{scalar})"
+    for required, fields in UTTCGen_FieldPlan(clazz):
+        indent = "\t"
+        if required is not None:
+            lines.append("\tif %s:" % " and ".join(f"{k!r} in d" for k in required))
+            indent = "\t\t"
+        for k, sub, reduce_arg, nested in fields:
+            lines.append(f"{indent}v = d[{k!r}]")
+            lines.append(f"{indent}self.{k} = {convert(sub, reduce_arg, nested)}")
+    if len(lines) == 1:
+        lines.append("\tpass")
+    exec("\n".join(lines), scope)
+    return scope["__init__"]
+
+# Typetree primitive -> struct format, see UTTCGen_CompileReader
+UTTCG_READER_FORMATS = {
+    "SInt8": "b", "UInt8": "B", "char": "B", "short": "h", "SInt16": "h", "unsigned short": "H", "UInt16": "H",
+    "int": "i", "SInt32": "i", "unsigned int": "I", "UInt32": "I", "Type*": "I", "long long": "q", "SInt64": "q",
+    "unsigned long long": "Q", "UInt64": "Q", "FileSize": "Q", "float": "f", "double": "d", "bool": "?",
+}
+UTTCG_READER_TYPES = {"?": bool, "f": float, "d": float}
+# Decode primitive array fields into read-only numpy arrays over the object's data, instead of lists.
+# Only applies to classes read by compiled readers, and arrays of at least UTTCG_NUMPY_MIN_LENGTH items.
+# Shorter ones are cheaper as lists, to read and to use
+UTTCG_NUMPY_ARRAYS = False
+UTTCG_NUMPY_MIN_LENGTH = 32
+# (full name, endian, UTTCG_NUMPY_ARRAYS) -> compiled reader, or None if the typetree can't be read that way
+UTTCG_Readers = dict()
+# Full names of the classes whose compiled reader failed on an object, which has been logged
+UTTCG_ReaderFailures = set()
+def UTTCGen_CompileReader(clazz, endian: str = "<", node: TypeTreeNode = None, numpy: bool = False, dicts: bool = False):
+    """Generate a straight-line reader for a UTTCGen class from its typetree
+
+    The reader is called with the object's raw data (and the ObjectReader to keep on the instance), and
+    returns what UTTCGen_AsInstance would, without the intermediate read_typetree dict. Runs of fixed-size
+    fields are read with one precompiled struct, primitive arrays in bulk, and alignment is resolved at
+    compile time wherever the offset is known. Raises NotImplementedError for typetrees it can't read.
+    The reader raises struct.error, ValueError or IndexError when the data doesn't fit the typetree,
+    including when any of it is left over.
+
+    With numpy set, fields that are arrays of primitives (e.g. List[float]) are numpy arrays instead, when
+    they're at least UTTCG_NUMPY_MIN_LENGTH long.
+
+    Arrays of structures that aren't classes (e.g. the Keyframes of an AnimationCurve) are read into dicts
+    first, as read_typetree does. That's faster done by read_typetree's C reader than in Python, so such
+    typetrees raise NotImplementedError too, unless dicts is set.
+    """
+    if numpy and np is None:
+        raise ImportError("numpy arrays need numpy to be installed")
+    scope, prelude, lines = dict(_new=object.__new__, _unpack=unpack_from, _frombuffer=np and np.frombuffer), [], ["def read(data, src):", "\tp = 0"]
+    temps, factories = count(), dict()
+    # Pending fixed-size run: struct format, the names it unpacks into and its size
+    fmt, names, off = "", [], 0
+    # Offset into the data mod 4 where the pending run starts, None if it's only known at runtime
+    mod, indent = 0, "\t"
+    # Number of arrays the elements being read are in
+    depth = 0
+    def bind(value) -> str:
+        name = "_T%d" % len(scope)
+        scope[name] = value
+        return name
+    def temp() -> str:
+        return "_v%d" % next(temps)
+    def emit(line: str):
+        lines.append(indent + line)
+    def flush():
+        nonlocal fmt, names, off, mod
+        if names:
+            emit(f"{', '.join(names)}, = {bind(Struct(endian + fmt).unpack_from)}(data, p)")
+        if off:
+            emit(f"p += {off}")
+            mod = None if mod is None else (mod + off) % 4
+        fmt, names, off = "", [], 0
+    def align():
+        nonlocal fmt, off, mod
+        if mod is None:
+            flush()
+            emit("p += -p & 3")
+            mod = 0
+        elif (mod + off) % 4:
+            pad = -(mod + off) % 4
+            fmt, off = fmt + "%dx" % pad, off + pad
+    def aligned(node) -> bool:
+        return bool(node.m_MetaFlag & 0x4000)
+    def primitive(node) -> str:
+        nonlocal fmt, off
+        code, name = UTTCG_READER_FORMATS[node.m_Type], temp()
+        fmt, off = fmt + code, off + calcsize(code)
+        names.append(name)
+        return name
+    def read_string(data, p, _int=Struct(endian + "i").unpack_from):
+        n = _int(data, p)[0]
+        p += 4
+        if 0 < n <= len(data) - p:
+            return str(data[p : p + n], "utf8", "surrogateescape"), (p + n + 3) & ~3
+        return "", p
+    def string() -> str:
+        nonlocal mod
+        flush()
+        name = temp()
+        emit(f"{name}, p = {bind(read_string)}(data, p)")
+        mod = 0 if mod == 0 else None
+        return name
+    def is_vector(node) -> bool:
+        return bool(node.m_Children) and node.m_Children[0].m_Type == "Array"
+    def shape(node) -> type:
+        """Python type read_typetree reads the node as"""
+        if node.m_Type in UTTCG_READER_FORMATS:
+            return UTTCG_READER_TYPES.get(UTTCG_READER_FORMATS[node.m_Type], int)
+        if node.m_Type == "string":
+            return str
+        if is_vector(node):
+            return list
+        if node.m_Type in {"pair", "TypelessData", "ReferencedObject", "ManagedReferencesRegistry"} or not node.m_Children:
+            raise NotImplementedError(node.m_Type)
+        return dict
+    def vector(node, item, ndarray: bool = False) -> str:
+        """Read a vector node, with item(element node) giving each element's expression in the loop.
+        item is None for primitive elements, which are read in bulk into a list, or a numpy array if ndarray is set"""
+        nonlocal fmt, names, off, mod, indent, depth
+        array = node.m_Children[0]
+        if len(array.m_Children) != 2:
+            raise NotImplementedError("Array node must have 2 children")
+        element = array.m_Children[1]
+        if shape(element) is list:
+            raise NotImplementedError("Nested arrays")
+        size = primitive(array.m_Children[0])
+        flush()
+        emit(f"if {size} < 0: raise ValueError('Negative length read from TypeTree')")
+        name = temp()
+        if item is None:
+            code = UTTCG_READER_FORMATS[element.m_Type]
+            if ndarray:
+                emit(f"if {size} < {UTTCG_NUMPY_MIN_LENGTH}: {name} = list(_unpack('{endian}%d{code}' % {size}, data, p))")
+                emit(f"else: {name} = _frombuffer(data, {bind(np.dtype(endian + code))}, {size}, p)")
+            else:
+                emit(f"{name} = list(_unpack('{endian}%d{code}' % {size}, data, p))")
+            emit(f"p += {calcsize(code)} * {size}")
+            mod = mod if calcsize(code) % 4 == 0 else None
+        else:
+            entry, start, depth = mod, len(lines), depth + 1
+            value = item(element)
+            if len(lines) == start and names and (entry is None or off % 4 == 0):
+                # Fixed-size elements that fit in one run, unpacked all at once
+                unpack = bind(Struct(endian + fmt).iter_unpack)
+                emit(f"{name} = [{value} for {', '.join(names)}, in {unpack}(data[p : p + {off} * {size}])]")
+                emit(f"p += {off} * {size}")
+                fmt, names, off, mod = "", [], 0, entry
+            else:
+                del lines[start:]
+                fmt, names, off, mod = "", [], 0, entry
+                emit(f"{name} = []")
+                emit(f"for _ in range({size}):")
+                indent, start = indent + "\t", len(lines)
+                value = item(element)
+                flush()
+                if mod != entry:  # Not at the same offset mod 4 on every iteration, so we can't know it statically
+                    del lines[start:]
+                    mod = None
+                    value = item(element)
+                    flush()
+                emit(f"{name}.append({value})")
+                indent, mod = indent[:-1], entry if mod == entry else None
+            depth -= 1
+        # Elements are never aligned one by one, the array is as a whole
+        if aligned(node) or aligned(array) or aligned(element):
+            align()
+        return name
+    def raw(node, top=True) -> str:
+        """Read a node as read_typetree(as_dict=True) would"""
+        kind = shape(node)
+        if kind is str:
+            value = string()
+        elif kind is list:
+            element = node.m_Children[0].m_Children[-1]
+            value = vector(node, None if element.m_Type in UTTCG_READER_FORMATS else lambda e: raw(e, False))
+            top = False  # Already aligned
+        elif kind is dict:
+            if depth and not dicts:
+                raise NotImplementedError("Arrays of %s, which read_typetree reads faster" % node.m_Type)
+            value = "{%s}" % ", ".join(f"{k!r}: {v}" for k, v in children(node))
+        else:
+            value = primitive(node)
+        if top and aligned(node):
+            align()
+        return value
+    def children(node) -> list:
+        return [(child.m_Name, raw(child)) for child in node.m_Children]
+    def call(origin, node) -> str:
+        """origin(**v) with v being the node's dict"""
+        if getattr(origin, "__fullname__", None) and UTTCG_Classes.get(origin.__fullname__) is origin:
+            return construct(origin, node)
+        if all(child.m_Name.isidentifier() for child in node.m_Children):
+            return f"{bind(origin)}(%s)" % ", ".join(f"{k}={v}" for k, v in children(node))
+        return f"{bind(origin)}(**{raw(node, False)})"
+    def scalar(origin, node, value) -> str:
+        """origin(v), for v = value that's already been read"""
+        if origin in PRIMITIVE_TYPES and origin is shape(node):
+            return value
+        return f"{bind(origin)}({value})"
+    def field(node, sub, reduce_arg, nested) -> str:
+        """Read a node and convert it like the compiled __init__ would (see UTTCGen_Compile)"""
+        origin = sub.__origin__ if getattr(sub, "__origin__", None) is not None else sub
+        kind = shape(node)
+        if kind is list and reduce_arg is not None:
+            element = node.m_Children[0].m_Children[-1]
+            if nested:
+                if shape(element) is not dict:
+                    raise NotImplementedError("%s(**%s)" % (reduce_arg, element.m_Type))
+                return vector(node, lambda e: call(reduce_arg, e))
+            if element.m_Type in UTTCG_READER_FORMATS:
+                if reduce_arg is shape(element):
+                    return vector(node, None, numpy)
+                return f"list(map({bind(reduce_arg)}, {vector(node, None)}))"
+            return vector(node, lambda e: scalar(reduce_arg, e, raw(e, False)))
+        if kind is dict and reduce_arg is not None and hasattr(sub, "__annotations__"):
+            value = call(sub, node)
+        elif kind is dict and origin not in PRIMITIVE_TYPES:
+            value = call(origin, node)
+        else:
+            value = scalar(origin, node, raw(node, False))
+        if aligned(node) and kind is not list:
+            align()
+        return value
+    def construct(clazz, node, extra: dict = None) -> str:
+        """clazz(**v) for a UTTCGen class, straight into its attributes"""
+        extra = extra or dict()
+        keys = {child.m_Name for child in node.m_Children} | set(extra)
+        if len(keys) != len(node.m_Children) + len(extra):
+            raise NotImplementedError("Duplicate field names")
+        fields = dict()
+        for required, group in UTTCGen_FieldPlan(clazz):
+            if required is None or all(k in keys for k in required):
+                for k, sub, reduce_arg, nested in group:
+                    if k not in keys:
+                        raise NotImplementedError("Missing field %s" % k)
+                    fields[k] = (sub, reduce_arg, nested)
+        values = dict(extra)
+        for child in node.m_Children:
+            if child.m_Name in fields:
+                values[child.m_Name] = field(child, *fields[child.m_Name])
+            else:
+                raw(child)
+        factory = factories.get((clazz, tuple(fields)), None)
+        if factory is None:
+            factory = factories[clazz, tuple(fields)] = "_F%d" % len(factories)
+            args = ["a%d" % i for i in range(len(fields))]
+            prelude.append(f"def {factory}({', '.join(args)}):")
+            prelude.append(f"\to = _new({bind(clazz)})")
+            prelude.extend(f"\to.{k} = {a}" for k, a in zip(fields, args))
+            prelude.append("\treturn o")
+        return f"{factory}({', '.join(values[k] for k in fields)})"
+    node = node or UTTCGen_Node(clazz)
+    value = construct(clazz, node, {"object_reader": "src"})
+    flush()
+    emit("if p != len(data): raise ValueError('%d bytes read, %d expected' % (p, len(data)))")
+    emit(f"return {value}")
+    exec("\n".join(prelude + lines), scope)
+    return scope["read"]
+
+def UTTCGen_Reader(clazz, endian: str = "<"):
+    """Compiled reader of a UTTCGen class, built once per endianness and UTTCG_NUMPY_ARRAYS. None if it can't have one"""
+    key = (clazz.__fullname__, endian, UTTCG_NUMPY_ARRAYS)
+    if key not in UTTCG_Readers:
+        try:
+            UTTCG_Readers[key] = UTTCGen_CompileReader(clazz, endian, numpy=UTTCG_NUMPY_ARRAYS)
+        except NotImplementedError:
+            UTTCG_Readers[key] = None
+    return UTTCG_Readers[key]
+
+def UTTCGen(fullname: str, typetree: dict):
+    """dataclass-like decorator for typetree classess with nested type support
+    
+    limitations:
+    - the behavior is similar to slotted dataclasses where shared attributes are inherited
+      but allows ommiting init of the parent if kwargs are not sufficient
+    - generally supports nested types, however untested and could be slow	
+    - and ofc, zero type checking and safeguards :/	
+
+    The constructor is compiled from UTTCGen_FieldPlan on first instantiation of the class.
+    """    
+    def __inner(clazz: T) -> T:
+        # Allow these to be propogated to the props
+        def __init__(self, **d):
+            clazz.__init__ = UTTCGen_Compile(clazz)
+            clazz.__init__(self, **d)
+        def __repr__(self) -> str:
+            return f"{clazz.__name__}({', '.join([f'{k}={getattr(self, k)!r}' for k in self.__annotations__])})"
+        def __save(self):
+            self.object_reader.save_typetree(self, UTTCGen_Node(clazz))
+        clazz.__init__ = __init__
+        clazz.__repr__ = __repr__
+        clazz.__typetree__ = typetree
+        clazz.__fullname__ = fullname
+        clazz.save = __save
+        UTTCG_Classes[fullname] = clazz
+        return clazz
+    return __inner
+
+
+# Helper functions
+def UTTCGen_Resolve(fullname: str) -> Type | None:
+    """Import the module defining a class by its full name from the precomputed .index, and return the class"""
+    if not UTTCG_Modules:
+        from .generated.index import UTTCG_Index
+        UTTCG_Modules.update((name, module) for module, names in UTTCG_Index.items() for name in names)
+    module = UTTCG_Modules.get(fullname, None)
+    if module is None:
+        return None
+    if module:
+        import_module(f"{UTTCG_PACKAGE}.{module}")
+    return UTTCG_Classes.get(fullname, None)
+
+def UTTCGen_GetClass(src: MonoBehaviour | str) -> Type:
+    """Get the class definition from MonoBehaviour or a full type name.
+
+    Modules are imported on demand, classes that are not used are never loaded."""
+    if isinstance(src, MonoBehaviour):
+        script = src.m_Script.read()
+        src = script.m_ClassName
+        if script.m_Namespace:
+            src = f"{script.m_Namespace}.{src}"    
+    clazz = UTTCG_Classes.get(src, None)
+    return clazz if clazz else UTTCGen_Resolve(src)
+
+def UTTCGen_DefaultNamespace(name: str):
+    """Module __getattr__ of the generated package. <default namespace> classes live in its _default module,
+    which is only imported once one of them is asked for"""
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return getattr(import_module(f"{UTTCG_PACKAGE}._default"), name)
+
+def UTTCGen_BuildNode(nodes: tuple) -> TypeTreeNode:
+    """Build a typetree from (m_Level, m_Type, m_Name, m_MetaFlag) node tuples"""
+    return TypeTreeNode.from_list([
+        TypeTreeNode(m_Level=level, m_Type=type, m_Name=name, m_ByteSize=0, m_Version=0, m_MetaFlag=flag)
+        for level, type, name, flag in nodes
+    ])
+
+def UTTCGen_RepairNode(node: TypeTreeNode, level: int = 0) -> TypeTreeNode:
+    """Move array elements some dumped typetrees (e.g. CubismFadeMotionData's) nest under `size` back into
+    their Array node, one level up, where read_typetree and the compiled readers expect them"""
+    node.m_Level = level
+    if node.m_Type == "Array" and len(node.m_Children) == 1 and node.m_Children[0].m_Children:
+        size = node.m_Children[0]
+        node.m_Children.append(size.m_Children.pop())
+    for child in node.m_Children:
+        UTTCGen_RepairNode(child, level + 1)
+    return node
+
+def UTTCGen_Node(cls) -> TypeTreeNode:
+    """Get the typetree of a class, built once from the precompiled store (or __typetree__ if it's not in there)"""
+    global UTTCG_Store
+    node = UTTCG_Nodes.get(cls.__fullname__, None)
+    if node is None:
+        if UTTCG_Store is None:
+            try:
+                with open(UTTCG_STORE_PATH, "rb") as f:
+                    UTTCG_Store = pickle.load(f)
+            except FileNotFoundError:
+                UTTCG_Store = dict()
+        nodes = UTTCG_Store.get(cls.__fullname__, None)
+        node = UTTCGen_RepairNode(UTTCGen_BuildNode(nodes) if nodes else TypeTreeNode.from_list(cls.__typetree__))
+        UTTCG_Nodes[cls.__fullname__] = node
+    return node
+
+T = TypeVar("T")
+def UTTCGen_AsInstance(cls : Type[T], src: MonoBehaviour | ObjectReader) -> T:
+    """Instantiate a class from the typetree definition and the raw data.
+
+    In most cases, this is the function you want to use.
+    It will read the typetree data from the MonoBehaviour instance and instantiate the class with the data.
+
+    Args:
+        cls: The class to instantiate. This should be a class that has been decorated with the UTTCGen decorator.
+        src (MonoBehaviour | ObjectReader): The MonoBehaviour instance or ObjectReader to read from.        
+
+    Returns:
+        An instance of the class defined by the typetree.
+    """
+    if isinstance(src, MonoBehaviour):
+        src = src.object_reader
+    read = UTTCGen_Reader(cls, src.reader.endian)
+    if read:
+        try:
+            src.reset()
+            return read(src.reader.read_bytes(src.byte_size), src)
+        except (StructError, ValueError, IndexError) as e:
+            # Let read_typetree have a go at this object, and raise if it's really broken. Others of the class
+            # may well have the typetree the reader was compiled from, so they still get to use it
+            if cls.__fullname__ not in UTTCG_ReaderFailures:
+                UTTCG_ReaderFailures.add(cls.__fullname__)
+                logger.debug("Compiled reader of %s failed, using read_typetree instead: %s", cls.__fullname__, e)
+    raw_def = src.read_typetree(UTTCGen_Node(cls), check_read=False)
+    instance = cls(object_reader=src, **raw_def)
+    return instance
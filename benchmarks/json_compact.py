@@ -0,0 +1,63 @@
+"""Size and encoding time of motion3 JSON: indented (the default) vs. --json-compact encoders
+
+Usage: python -m benchmarks.json_compact [--clips N] [--curves N] [--frames N] [--number N]
+"""
+
+import argparse, random, timeit
+from UnityPyLive2DExtractor.__main__ import JSON_ENCODERS, FLAGS, dump_json
+
+
+def sample(index: int, curves: int, frames: int) -> dict:
+    """Synthesize a motion3 like to_motion3 makes them, with linear segments at 30 FPS"""
+    rng = random.Random(index)
+    segments = lambda: [0, 0.0, rng.random()] + [
+        x for i in range(1, frames) for x in (0, i / 30, rng.random())
+    ]
+    return {
+        "Version": 3,
+        "Meta": {
+            "Name": "motion_%d" % index,
+            "Duration": (frames - 1) / 30,
+            "Fps": 30.0,
+            "Loop": True,
+            "AreBeziersRestricted": True,
+            "CurveCount": curves,
+            "UserDataCount": 0,
+            "TotalPointCount": curves * frames,
+            "TotalSegmentCount": curves * (frames - 1),
+            "TotalUserDataSize": 0,
+        },
+        "Curves": [
+            {"Target": "Parameter", "Id": "Param%d" % i, "Segments": segments()}
+            for i in range(curves)
+        ],
+    }
+
+
+def bench(name: str, clips: list, number: int):
+    size = sum(len(dump_json(clip)) for clip in clips)
+    seconds = timeit.timeit(lambda: [dump_json(clip) for clip in clips], number=number)
+    print("%-10s %12d bytes  %8.1f ms/run" % (name, size, 1000 * seconds / number))
+    return size, seconds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clips", type=int, default=200, help="Clips in the set")
+    parser.add_argument("--curves", type=int, default=60, help="Curves per clip")
+    parser.add_argument("--frames", type=int, default=120, help="Keyframes per curve")
+    parser.add_argument("--number", type=int, default=3, help="Runs per encoder")
+    args = parser.parse_args()
+    clips = [sample(i, args.curves, args.frames) for i in range(args.clips)]
+    base_size, base_time = bench("indent=4", clips, args.number)
+    FLAGS.json_compact = True
+    for name, encoder in JSON_ENCODERS.items():
+        if not encoder:
+            print("%-10s not installed" % name)
+            continue
+        FLAGS.json_encoder = name
+        size, seconds = bench(name, clips, args.number)
+        print(
+            "%-10s %11.1f%% size  %8.1fx speed"
+            % ("", 100 * size / base_size, base_time / seconds)
+        )
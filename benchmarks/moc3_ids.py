@@ -0,0 +1,62 @@
+"""Part/Parameter ID reads of moc3s: sssekai's read_moc3 vs. read_moc3_ids
+
+Usage: python -m benchmarks.moc3_ids [--parts N] [--parameters N] [--size BYTES] [--number N]
+"""
+
+import argparse, io, random, struct, timeit
+from sssekai.fmt.moc3 import read_moc3
+from UnityPyLive2DExtractor.__main__ import read_moc3_ids
+
+
+def sample(parts: int, parameters: int, size: int, rng: random.Random) -> bytes:
+    """Synthesize a moc3 with just enough of a header for both readers, padded to `size` bytes"""
+    name = lambda prefix: prefix + "".join(
+        rng.choice("ABCXYZ_0123é") for _ in range(rng.randrange(1, 24))
+    )
+    ids = [name("Part") for _ in range(parts)], [
+        name("Param") for _ in range(parameters)
+    ]
+    counts, tables = 0x200, 0x800
+    buf = bytearray(max(size, tables + 0x40 * (parts + parameters)))
+    buf[0:6] = b"MOC3\x03\x00"
+    struct.pack_into("<III", buf, counts, parts, 0, 0)
+    struct.pack_into("<I", buf, counts + 0x14, parameters)
+    struct.pack_into("<I", buf, 0x40, counts)
+    struct.pack_into("<I", buf, 0x4C, tables)
+    struct.pack_into("<I", buf, 0x108, tables + 0x40 * parts)
+    for i, s in enumerate(ids[0] + ids[1]):
+        data = s.encode("utf-8")
+        buf[tables + 0x40 * i : tables + 0x40 * i + len(data)] = data
+    return bytes(buf), ids
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--parts", type=int, default=100, help="Parts per moc")
+    parser.add_argument(
+        "--parameters", type=int, default=200, help="Parameters per moc"
+    )
+    parser.add_argument("--size", type=int, default=4 << 20, help="Size of the moc")
+    parser.add_argument("--number", type=int, default=50, help="Reads")
+    args = parser.parse_args()
+    moc, ids = sample(args.parts, args.parameters, args.size, random.Random(0))
+    assert read_moc3(io.BytesIO(moc)) == ids, "read_moc3 doesn't agree with the sample"
+    assert read_moc3_ids(memoryview(moc)) == ids
+    for garbage in (b"\x00" * len(moc), b"MOC3\x00" + moc[5:]):
+        try:
+            read_moc3_ids(garbage)
+            raise AssertionError("Obfuscated header was read")
+        except ValueError:
+            pass
+    old = timeit.timeit(lambda: read_moc3(io.BytesIO(moc)), number=args.number)
+    new = timeit.timeit(lambda: read_moc3_ids(memoryview(moc)), number=args.number)
+    print(
+        "%d bytes, %d IDs  read_moc3 %8.3f ms  read_moc3_ids %8.3f ms  (%.1fx)"
+        % (
+            len(moc),
+            args.parts + args.parameters,
+            1000 * old / args.number,
+            1000 * new / args.number,
+            old / new,
+        )
+    )
@@ -0,0 +1,111 @@
+"""Construction throughput of UTTCGen classes: reflective (pre-compiled) vs. compiled constructors
+
+Usage: python -m benchmarks.uttcgen_init [--particles N] [--number N]
+"""
+
+import argparse, timeit
+from UnityPy.helpers.TypeTreeNode import TypeTreeNode
+import UnityPyLive2DExtractor.uttcgen_runtime as runtime
+from UnityPyLive2DExtractor.uttcgen_runtime import UTTCG_Classes
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Framework.Physics import (
+    CubismPhysicsController,
+)
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Framework.MotionFade import (
+    CubismFadeMotionData,
+)
+
+
+def reflective_init(clazz):
+    """The original per-instance reflective UTTCGen constructor"""
+
+    def __init__(self, **d):
+        def reduce_init(clazz, **d):
+            types: dict = clazz.__annotations__
+            for k, sub in types.items():
+                if type(sub) == str:
+                    sub = eval(sub, vars(runtime))
+                while sub.__name__ == "Optional":
+                    sub = sub.__args__[0]
+                reduce_arg = getattr(sub, "__args__", [None])[0]
+                if k in runtime.REFERENCED_ARGS:
+                    reduce_arg = sub = lambda x: x
+                if reduce_arg is not None and isinstance(d[k], list):
+                    if hasattr(reduce_arg, "__annotations__") or hasattr(
+                        reduce_arg, "__args__"
+                    ):
+                        setattr(self, k, [reduce_arg(**x) for x in d[k]])
+                    else:
+                        setattr(self, k, [reduce_arg(x) for x in d[k]])
+                elif (
+                    reduce_arg is not None
+                    and isinstance(d[k], dict)
+                    and hasattr(sub, "__annotations__")
+                ):
+                    setattr(self, k, sub(**d[k]))
+                else:
+                    if hasattr(sub, "__origin__") and sub.__origin__ is not None:
+                        sub = sub.__origin__
+                    if isinstance(d[k], dict):
+                        setattr(self, k, sub(**d[k]))
+                    else:
+                        setattr(self, k, sub(d[k]))
+
+        def reduce_base(clazz, **d):
+            for __base__ in clazz.__bases__:
+                if hasattr(__base__, "__annotations__"):
+                    types: dict = __base__.__annotations__
+                    args = {k: d[k] for k in types if k in d}
+                    if len(args) == len(types):
+                        super(clazz, self).__init__(**args)
+                        reduce_init(__base__, **d)
+                reduce_base(__base__, **d)
+
+        reduce_base(clazz, **d)
+        reduce_init(clazz, **d)
+
+    return __init__
+
+
+def sample(node: TypeTreeNode, length: int):
+    """Synthesize a read_typetree-like dict for a typetree node, with every array `length` long"""
+    if node.m_Type == "string":
+        return "ParamAngleX"
+    if node.m_Type in ("float", "double"):
+        return 0.5
+    if not node.m_Children:
+        return 1
+    if node.m_Children[0].m_Type == "Array":
+        item = node.m_Children[0].m_Children[-1]
+        while item.m_Name != "data":  # Some dumped typetrees nest it under `size`
+            item = item.m_Children[-1]
+        return [sample(item, length) for _ in range(length)]
+    return {child.m_Name: sample(child, length) for child in node.m_Children}
+
+
+def bench(clazz, data: dict, number: int):
+    compiled = {c: c.__dict__["__init__"] for c in UTTCG_Classes.values()}
+    clazz(**data)  # Compile on first use, outside of the timing
+    new = timeit.timeit(lambda: clazz(**data), number=number)
+    for c in UTTCG_Classes.values():
+        c.__init__ = reflective_init(c)
+    try:
+        old = timeit.timeit(lambda: clazz(**data), number=number)
+    finally:
+        for c, init in compiled.items():
+            c.__init__ = init
+    print(
+        "%-28s reflective %8.1f/s  compiled %8.1f/s  (%.1fx)"
+        % (clazz.__name__, number / old, number / new, old / new)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--particles", type=int, default=64, help="Array length")
+    parser.add_argument("--number", type=int, default=20, help="Constructions")
+    args = parser.parse_args()
+    for clazz in (CubismPhysicsController, CubismFadeMotionData):
+        node = TypeTreeNode.from_list(clazz.__typetree__)
+        data = sample(node, args.particles)
+        # Top-level objects also carry the reader, as in UTTCGen_AsInstance
+        bench(clazz, dict(object_reader=None, **data), args.number)
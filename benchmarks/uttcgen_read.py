@@ -0,0 +1,109 @@
+"""Read throughput of UTTCGen classes: read_typetree + compiled constructor vs. compiled readers
+
+Every sample is checked field by field against the read_typetree path before timing.
+Readers are compiled with dicts=True, so CubismFadeMotionData is timed even though the extractor
+reads it with read_typetree, which is faster for it.
+
+Usage: python -m benchmarks.uttcgen_read [--length N] [--moc N] [--samples N] [--number N] [--numpy]
+"""
+
+import argparse, random, timeit
+from UnityPy.helpers import TypeTreeHelper
+from UnityPy.helpers.TypeTreeNode import TypeTreeNode
+from UnityPy.streams.EndianBinaryReader import EndianBinaryReader
+from UnityPy.streams.EndianBinaryWriter import EndianBinaryWriter
+from UnityPyLive2DExtractor.uttcgen_runtime import UTTCGen_CompileReader, UTTCGen_Node
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Core import CubismMoc
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Framework.Physics import (
+    CubismPhysicsController,
+)
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Framework.MotionFade import (
+    CubismFadeMotionData,
+)
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Rendering import CubismRenderer
+
+
+def sample(node: TypeTreeNode, length: int, rng: random.Random):
+    """Synthesize a read_typetree-like dict for a typetree node, with arrays up to `length` long"""
+    if node.m_Type == "string":
+        return "".join(rng.choice("ParamAngleXé") for _ in range(rng.randrange(8)))
+    if node.m_Type in ("float", "double"):
+        return rng.uniform(-1, 1)
+    if node.m_Type == "bool":
+        return rng.random() < 0.5
+    if not node.m_Children:
+        return rng.randrange(256)
+    if node.m_Children[0].m_Type == "Array":
+        item = node.m_Children[0].m_Children[1]
+        return [sample(item, length, rng) for _ in range(rng.randrange(length + 1))]
+    return {child.m_Name: sample(child, length, rng) for child in node.m_Children}
+
+
+def same(a, b, path: str) -> None:
+    """Assert a and b are of the same type and have equal fields, recursively.
+    numpy arrays are equal to lists of the same items"""
+    if type(a).__name__ == "ndarray":
+        assert isinstance(b, list), "%s: %r != %r" % (path, type(a), type(b))
+        assert a.tolist() == b, "%s: %r != %r" % (path, a, b)
+        return
+    assert type(a) is type(b), "%s: %r != %r" % (path, type(a), type(b))
+    if isinstance(a, list):
+        assert len(a) == len(b), "%s: %d != %d items" % (path, len(a), len(b))
+        for i, (x, y) in enumerate(zip(a, b)):
+            same(x, y, "%s[%d]" % (path, i))
+    elif hasattr(a, "__dict__"):
+        assert list(vars(a)) == list(vars(b)), "%s: %r != %r" % (path, vars(a), vars(b))
+        for k in vars(a):
+            same(getattr(a, k), getattr(b, k), "%s.%s" % (path, k))
+    elif hasattr(type(a), "__attrs_attrs__"):
+        for field in type(a).__attrs_attrs__:
+            k = field.name
+            same(getattr(a, k), getattr(b, k), "%s.%s" % (path, k))
+    else:
+        assert a == b, "%s: %r != %r" % (path, a, b)
+
+
+def reference(clazz, node: TypeTreeNode, data: bytes, endian: str):
+    """What UTTCGen_AsInstance builds without a compiled reader"""
+    reader = EndianBinaryReader(data, endian=endian)
+    raw = TypeTreeHelper.read_typetree(
+        node, reader, as_dict=True, byte_size=len(data), check_read=False
+    )
+    return clazz(object_reader=None, **raw)
+
+
+def bench(clazz, node: TypeTreeNode, args, length: int = None):
+    rng = random.Random(clazz.__name__)
+    for endian in (">", "<"):  # Time the last, little-endian sample
+        read = UTTCGen_CompileReader(clazz, endian, node, args.numpy, dicts=True)
+        for _ in range(args.samples):
+            writer = EndianBinaryWriter(endian=endian)
+            TypeTreeHelper.write_typetree(
+                sample(node, length or args.length, rng), node, writer
+            )
+            data = writer.bytes
+            same(read(data, None), reference(clazz, node, data, endian), clazz.__name__)
+    old = timeit.timeit(lambda: reference(clazz, node, data, "<"), number=args.number)
+    new = timeit.timeit(lambda: read(data, None), number=args.number)
+    print(
+        "%-28s %6d bytes  read_typetree %8.1f/s  compiled %8.1f/s  (%.1fx)"
+        % (clazz.__name__, len(data), args.number / old, args.number / new, old / new)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=64, help="Max. array length")
+    parser.add_argument(
+        "--samples", type=int, default=50, help="Checked samples per endianness"
+    )
+    parser.add_argument("--moc", type=int, default=1 << 16, help="Max. moc size")
+    parser.add_argument("--number", type=int, default=2000, help="Reads")
+    parser.add_argument(
+        "--numpy", action="store_true", help="Read primitive arrays into numpy arrays"
+    )
+    args = parser.parse_args()
+    bench(CubismPhysicsController, UTTCGen_Node(CubismPhysicsController), args)
+    bench(CubismFadeMotionData, UTTCGen_Node(CubismFadeMotionData), args)
+    bench(CubismRenderer, UTTCGen_Node(CubismRenderer), args)
+    bench(CubismMoc, UTTCGen_Node(CubismMoc), args, args.moc)
@@ -16,12 +16,14 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/mos9527/UnityPyLive2DExtractor",
     packages=setuptools.find_packages(),
+    package_data={"UnityPyLive2DExtractor.generated": ["typetrees.pickle"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: Apache Software License",
         "Operating System :: OS Independent",
     ],
     install_requires=["sssekai>=0.7.12"],
+    extras_require={"fast": ["orjson", "numpy"]},
     entry_points={
         "console_scripts": [
             "UnityPyLive2DExtractor = UnityPyLive2DExtractor.__main__:__main__"
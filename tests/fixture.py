@@ -0,0 +1,288 @@
+"""Synthetic Unity serialized files with Live2D models in them, for the tests"""
+
+import os, random, struct
+from zlib import crc32
+from UnityPy.enums import ClassIDType
+from UnityPy.files.ObjectReader import ObjectReader
+from UnityPy.files.SerializedFile import (
+    FileIdentifier,
+    LocalSerializedObjectIdentifier,
+    SerializedFile,
+    SerializedFileHeader,
+    SerializedType,
+)
+from UnityPy.helpers import TypeTreeHelper
+from UnityPy.helpers.Tpk import get_typetree_node
+from UnityPy.helpers.TypeTreeNode import TypeTreeNode
+from UnityPy.helpers.UnityVersion import UnityVersion
+from UnityPy.streams import EndianBinaryWriter
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Core import CubismModel, CubismMoc
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Framework.Physics import (
+    CubismPhysicsController,
+)
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Rendering import CubismRenderer
+
+VERSION = "2021.3.0f1"
+
+
+def default(node: TypeTreeNode):
+    """Zero value of a typetree node, as read_typetree(as_dict=True) would read it"""
+    if node.m_Type == "string":
+        return ""
+    if node.m_Type == "TypelessData":
+        return b""
+    if node.m_Children and node.m_Children[0].m_Type == "Array":
+        return []
+    if not node.m_Children:
+        return 0.0 if node.m_Type in ("float", "double") else 0
+    if node.m_Type == "pair":
+        return tuple(map(default, node.m_Children))
+    return {child.m_Name: default(child) for child in node.m_Children}
+
+
+def encode(node: TypeTreeNode, fields: dict) -> bytes:
+    writer = EndianBinaryWriter(endian="<")
+    TypeTreeHelper.write_typetree(fields, node, writer)
+    return writer.bytes
+
+
+def builtin(class_id: int, **fields) -> bytes:
+    """A builtin Unity object of class_id, zeroed but for fields"""
+    node = get_typetree_node(class_id, UnityVersion.from_str(VERSION))
+    return encode(node, {**default(node), **fields})
+
+
+def complete(node: TypeTreeNode) -> TypeTreeNode:
+    """Fill in what saving a typetree needs, and __typetree__ and Tpk's nodes leave out"""
+    for i, n in enumerate(node.traverse()):
+        n.m_Index = i
+        n.m_ByteSize = -1 if n.m_ByteSize is None else n.m_ByteSize
+        n.m_Version = 1 if n.m_Version is None else n.m_Version
+        n.m_TypeFlags = (
+            int(n.m_Type == "Array") if n.m_TypeFlags is None else n.m_TypeFlags
+        )
+        n.m_RefTypeHash = n.m_RefTypeHash or 0
+    return node
+
+
+def ptr(path_id: int, file_id: int = 0) -> dict:
+    return {"m_FileID": file_id, "m_PathID": path_id}
+
+
+def moc3(parts: list[str], parameters: list[str]) -> bytes:
+    """Minimal moc3 with only the Part and Parameter ID tables filled in"""
+    data = bytearray(0x800 + 0x40 * (len(parts) + len(parameters)))
+    data[0:5] = b"MOC3\x03"
+    struct.pack_into("<I", data, 0x40, 0x200)  # Count info
+    struct.pack_into("<I", data, 0x200, len(parts))
+    struct.pack_into("<I", data, 0x214, len(parameters))
+    struct.pack_into("<I", data, 0x4C, 0x800)
+    struct.pack_into("<I", data, 0x108, 0x800 + 0x40 * len(parts))
+    for i, name in enumerate(parts + parameters):
+        data[0x800 + 0x40 * i : 0x800 + 0x40 * i + len(name)] = name.encode()
+    return bytes(data)
+
+
+class Builder:
+    """Objects of one serialized file, written out with save()"""
+
+    def __init__(self, base_id: int = 1, version: int = 22, typetrees: bool = False):
+        # (path_id, class_id, data, script path_id or None)
+        self.objects = list()
+        self.scripts = dict()
+        self.externals = list()
+        self.next_id = base_id
+        # Serialized file version. PathIDs are 32-bit before 14
+        self.version = version
+        # Whether to save the typetrees of the objects, which are script path_id -> node for MonoBehaviours
+        self.typetrees = typetrees
+        self.nodes = dict()
+
+    def pid(self) -> int:
+        self.next_id += 1
+        return self.next_id
+
+    def add(self, class_id: int, data: bytes, script=None, path_id=None) -> int:
+        path_id = path_id or self.pid()
+        self.objects.append((path_id, class_id, data, script))
+        return path_id
+
+    def external(self, path: str) -> int:
+        """File ID of the external file at path"""
+        self.externals.append(path)
+        return len(self.externals)
+
+    def script(self, fullname: str) -> int:
+        if fullname not in self.scripts:
+            namespace, _, name = fullname.rpartition(".")
+            self.scripts[fullname] = self.add(
+                115,
+                builtin(
+                    115,
+                    m_Name=name,
+                    m_ClassName=name,
+                    m_Namespace=namespace,
+                    m_AssemblyName="Live2D.Cubism.dll",
+                ),
+            )
+        return self.scripts[fullname]
+
+    def mono(self, clazz, go: int, nodes: list = None, **fields) -> int:
+        """A MonoBehaviour of clazz, or of `nodes` if given"""
+        script = self.script(clazz.__fullname__)
+        nodes = nodes or clazz.__typetree__
+        if self.version < 14:
+            nodes = [
+                {**n, "m_Type": "int"} if n["m_Type"] == "SInt64" else n for n in nodes
+            ]
+        node = self.nodes[script] = TypeTreeNode.from_list(nodes)
+        head = {"m_GameObject": ptr(go), "m_Enabled": 1, "m_Script": ptr(script)}
+        data = encode(node, {**default(node), **head, **fields})
+        return self.add(114, data, script=script)
+
+    def gameobject(self, name: str, transform: int, components: list, path_id: int):
+        components = [{"component": ptr(c)} for c in [transform] + components]
+        data = builtin(1, m_Name=name, m_Component=components, m_IsActive=1)
+        return self.add(1, data, path_id=path_id)
+
+    def transform(self, go: int, children: list, father: int = 0, path_id=None):
+        data = builtin(
+            4,
+            m_GameObject=ptr(go),
+            m_Children=[ptr(c) for c in children],
+            m_Father=ptr(father),
+            m_LocalRotation={"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0},
+        )
+        return self.add(4, data, path_id=path_id)
+
+    def texture(self, name: str, size: int = 4, seed: int = 0) -> int:
+        """RGBA32 texture of random pixels"""
+        data = random.Random(seed).randbytes(size * size * 4)
+        fields = dict(m_Name=name, m_Width=size, m_Height=size, m_TextureFormat=4)
+        fields.update(m_CompleteImageSize=len(data), m_MipCount=1, m_ImageCount=1)
+        fields.update(m_TextureDimension=2, **{"image data": data})
+        return self.add(28, builtin(28, **fields))
+
+    def clip(self, name: str, paths: list[str], frames: int = 5) -> int:
+        """AnimationClip with a dense curve bound to each of paths"""
+        node = get_typetree_node(74, UnityVersion.from_str(VERSION))
+        fields = {**default(node), "m_Name": name, "m_SampleRate": 30.0}
+        muscle = fields["m_MuscleClip"]
+        muscle["m_StopTime"] = (frames - 1) / 30.0
+        muscle["m_Clip"]["data"]["m_DenseClip"].update(
+            m_FrameCount=frames,
+            m_CurveCount=len(paths),
+            m_SampleRate=30.0,
+            m_SampleArray=[
+                i * 0.1 + j for i in range(frames) for j in range(len(paths))
+            ],
+        )
+        fields["m_ClipBindingConstant"]["genericBindings"] = [
+            {
+                "path": crc32(path.encode()),
+                "attribute": 0,
+                "script": ptr(0),
+                "typeID": 114,
+                "customType": 0,
+                "isPPtrCurve": 0,
+                "isIntCurve": 0,
+                "isSerializeReferenceCurve": 0,
+            }
+            for path in paths
+        ]
+        return self.add(74, encode(node, fields))
+
+    def model(self, name: str, parts: list, parameters: list, textures: list) -> int:
+        """A Live2D model with one drawable per texture. Textures in other files are (path_id, file_id)"""
+        go, transform = self.pid(), self.pid()
+        moc = self.mono(CubismMoc, 0, _bytes=list(moc3(parts, parameters)))
+        model = self.mono(CubismModel, go, _moc=ptr(moc))
+        physics = self.mono(CubismPhysicsController, go)
+        children = list()
+        for i, texture in enumerate(textures):
+            child_go, child = self.pid(), self.pid()
+            texture = ptr(*texture) if isinstance(texture, tuple) else ptr(texture)
+            renderer = self.mono(CubismRenderer, child_go, _mainTexture=texture)
+            self.gameobject(f"Drawable{i}", child, [renderer], child_go)
+            self.transform(child_go, [], transform, path_id=child)
+            children.append(child)
+        self.gameobject(name, transform, [model, physics], go)
+        self.transform(go, children, path_id=transform)
+        return go
+
+    def save(self, path: str):
+        file = SerializedFile.__new__(SerializedFile)
+        file.header = SerializedFileHeader.__new__(SerializedFileHeader)
+        file.header.version, file.header.endian = self.version, "<"
+        file.header.reserved = b"\0\0\0"
+        file.unity_version, file._m_target_platform = VERSION, 5
+        file._enable_type_tree, file.big_id_enabled, file.unknown = self.typetrees, 0, 0
+        file.userInformation, file.ref_types = "", []
+        kinds = list(dict.fromkeys((c, s) for _, c, _, s in self.objects))
+        scripts = sorted({s for _, _, _, s in self.objects if s})
+        file.types = list()
+        for class_id, script in kinds:
+            kind = SerializedType.__new__(SerializedType)
+            kind.class_id, kind.is_stripped_type, kind.node = class_id, False, None
+            if self.typetrees:
+                kind.node = complete(
+                    self.nodes.get(script)
+                    or get_typetree_node(class_id, UnityVersion.from_str(VERSION))
+                )
+            kind.script_type_index = scripts.index(script) if script else -1
+            kind.script_id = kind.old_type_hash = bytes(16)
+            kind.type_dependencies = []
+            file.types.append(kind)
+        file.script_types = list()
+        for script in scripts:
+            ref = LocalSerializedObjectIdentifier.__new__(
+                LocalSerializedObjectIdentifier
+            )
+            ref.local_serialized_file_index, ref.local_identifier_in_file = 0, script
+            file.script_types.append(ref)
+        file.externals = list()
+        for external in self.externals:
+            ref = FileIdentifier.__new__(FileIdentifier)
+            ref.temp_empty, ref.guid, ref.type, ref.path = "", bytes(16), 0, external
+            file.externals.append(ref)
+        file.objects = dict()
+        for path_id, class_id, data, script in self.objects:
+            kind = kinds.index((class_id, script))
+            file.objects[path_id] = ObjectReader(
+                file, None, path_id, kind, file.types[kind], class_id,
+                ClassIDType(class_id), 0, len(data), None, None, data=data,
+            )  # fmt: skip
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(file.save())
+
+
+def make_game(root: str, models: int = 2, shared_only: bool = True):
+    """A game install of a shared texture file, a file per model and one with the AnimationClips
+
+    Every model has two textures of its own and the shared one. With `shared_only`, there's also
+    a model named sharedonly whose only texture is the shared one."""
+    shared = Builder(base_id=10000)
+    texture = shared.texture("shared_tex", seed=99)
+    shared.save(os.path.join(root, "shared", "cab-shared"))
+    for i in range(models + shared_only):
+        builder = Builder()
+        external = builder.external("archive:/cab-shared/cab-shared")
+        if i == models:
+            name, textures = "sharedonly", []
+        else:
+            name = f"model{i}"
+            textures = [
+                builder.texture(f"{name}_tex{j}", seed=10 * i + j) for j in range(2)
+            ]
+        parts = [f"Part{i}_{j}" for j in range(3)]
+        parameters = [f"Param{i}_{j}" for j in range(4)]
+        builder.model(name, parts, parameters, textures + [(texture, external)])
+        builder.save(os.path.join(root, "models", f"cab-{name}"))
+    anim = Builder()
+    anim.clip(
+        "motion_a", ["Parameters/Param0_0", "Parameters/Param0_1", "Parts/Part0_2"]
+    )
+    anim.clip("motion_b", ["Parameters/Param1_3"])
+    anim.clip("not_live2d", ["Body/Arm", "Body/Leg"])
+    anim.save(os.path.join(root, "anim", "cab-anim"))
@@ -0,0 +1,35 @@
+import pytest
+import UnityPy
+from fixture import Builder, moc3
+from UnityPyLive2DExtractor.__main__ import read_moc_bytes, read_script_fullname
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Core import CubismMoc
+
+
+@pytest.mark.parametrize("version", [13, 22])
+def test_head(tmp_path, version):
+    """PathIDs are 32-bit before serialized file version 14"""
+    builder = Builder(version=version)
+    data = moc3(["Part"], ["Param"])
+    moc = builder.mono(CubismMoc, 0, _bytes=list(data))
+    builder.save(str(tmp_path / "cab"))
+    objects = UnityPy.load(str(tmp_path / "cab")).objects
+    reader = next(obj for obj in objects if obj.path_id == moc)
+    assert reader.assets_file.header.version == version
+    assert read_script_fullname(reader) == CubismMoc.__fullname__
+    assert bytes(read_moc_bytes(reader)) == data
+
+
+def test_own_typetree(tmp_path):
+    """MonoBehaviours with typetrees laid out differently are read with them"""
+    builder = Builder(typetrees=True)
+    nodes = list(CubismMoc.__typetree__)
+    at = next(i for i, node in enumerate(nodes) if node["m_Name"] == "_bytes")
+    version = {"m_Type": "int", "m_Name": "_version", "m_Level": 1, "m_MetaFlag": 0}
+    nodes.insert(at, version)
+    data = moc3(["Part"], ["Param"])
+    moc = builder.mono(CubismMoc, 0, nodes, _version=5, _bytes=list(data))
+    builder.save(str(tmp_path / "cab"))
+    objects = UnityPy.load(str(tmp_path / "cab")).objects
+    reader = next(obj for obj in objects if obj.path_id == moc)
+    assert read_script_fullname(reader) == CubismMoc.__fullname__
+    assert bytes(read_moc_bytes(reader)) == data
@@ -0,0 +1,51 @@
+import json, random
+import pytest
+from sssekai.fmt.motion3 import to_motion3
+from sssekai.unity.AnimationClip import KeyframeHelper
+from UnityPyLive2DExtractor.__main__ import motion3_segments
+
+INF = float("inf")
+
+
+def curve(rnd: random.Random, length: int, ints: bool) -> list:
+    keys = list()
+    for i in range(length):
+        key = KeyframeHelper(
+            time=i / 30 + rnd.random() * 0.01 * (i > 0),
+            typeID=0,
+            value=rnd.randrange(5) if ints else rnd.choice([rnd.random(), 1.0]),
+            isDense=rnd.random() < 0.2,
+            isConstant=rnd.random() < 0.1,
+            inSlope=rnd.choice([rnd.random(), INF, -INF, 0.0]),
+            outSlope=rnd.choice([rnd.random(), INF, 2.0]),
+        )
+        if keys:
+            key.prev, keys[-1].next = keys[-1], key
+        keys.append(key)
+    return keys
+
+
+class Curve:
+    Path = 0
+
+    def __init__(self, keys: list):
+        self.Data = keys
+
+
+class Helper:
+    Name, Duration, SampleRate = "motion", 1.0, 30.0
+
+    def __init__(self, curves: list):
+        self.FloatCurves = curves
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_same_as_to_motion3(seed):
+    rnd = random.Random(seed)
+    for _ in range(20):
+        keys = curve(rnd, rnd.randrange(2, 100), ints=rnd.random() < 0.2)
+        motion = to_motion3(Helper([Curve(keys)]), {0: "Parameters/Param"})
+        segments, points = motion3_segments(keys)
+        # Compared as JSON, which is what's written, and where nan == nan
+        assert json.dumps(segments) == json.dumps(motion["Curves"][0]["Segments"])
+        assert points == motion["Meta"]["TotalPointCount"]
@@ -0,0 +1,53 @@
+import os, subprocess, sys, tarfile, zipfile
+import pytest
+from fixture import make_game
+
+
+@pytest.fixture(scope="module")
+def game(tmp_path_factory):
+    root = tmp_path_factory.mktemp("game")
+    make_game(str(root))
+    return root
+
+
+def extract(game, outdir, *args):
+    subprocess.run(
+        [sys.executable, "-m", "UnityPyLive2DExtractor", str(game), str(outdir), *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.parametrize("args", [(), ("--jobs", "2"), ("--stream",)])
+def test_shared_textures_only(game, tmp_path, args):
+    extract(game, tmp_path, *args)
+    shared = tmp_path / "sharedonly" / "Textures" / "shared_tex.png"
+    assert (
+        shared.read_bytes()
+        == (tmp_path / "model0/Textures/shared_tex.png").read_bytes()
+    )
+    assert (tmp_path / "sharedonly" / "sharedonly.model3.json").exists()
+
+
+@pytest.mark.parametrize("format", ["zip", "tar"])
+@pytest.mark.parametrize("per", ["run", "model"])
+def test_archive_links(game, tmp_path, format, per):
+    extract(game, tmp_path, "--archive", format, "--archive-per", per)
+    members = dict()
+    for archive in tmp_path.glob(f"*.{format}"):
+        if format == "zip":
+            with zipfile.ZipFile(archive) as file:
+                names = file.namelist()
+                members.update((name, file.read(name)) for name in names)
+        else:
+            with tarfile.open(archive) as file:
+                names = file.getnames()
+                members.update(
+                    (name, file.extractfile(name).read())
+                    for name in names
+                    if file.getmember(name).isfile() or file.getmember(name).islnk()
+                )
+        assert len(names) == len(set(names))
+    shared = members["sharedonly/Textures/shared_tex.png"]
+    assert shared == members["model0/Textures/shared_tex.png"]
+    assert shared == members["model1/Textures/shared_tex.png"]
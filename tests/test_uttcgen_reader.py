@@ -0,0 +1,88 @@
+import random
+from itertools import chain
+import pytest
+import UnityPy
+from UnityPy.files.ObjectReader import ObjectReader
+from UnityPy.helpers import TypeTreeHelper
+from UnityPy.helpers.TypeTreeNode import TypeTreeNode
+from UnityPy.streams.EndianBinaryWriter import EndianBinaryWriter
+from benchmarks.uttcgen_init import reflective_init
+from benchmarks.uttcgen_read import reference, same, sample
+from fixture import Builder, default, encode, ptr
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Core import CubismMoc
+from UnityPyLive2DExtractor.generated.Live2D.Cubism.Rendering import CubismRenderer
+from UnityPyLive2DExtractor.generated.index import UTTCG_Index
+from UnityPyLive2DExtractor.uttcgen_runtime import (
+    UTTCG_NUMPY_MIN_LENGTH,
+    UTTCG_Classes,
+    UTTCG_Readers,
+    UTTCGen_AsInstance,
+    UTTCGen_CompileReader,
+    UTTCGen_GetClass,
+    UTTCGen_Node,
+)
+
+
+def test_fallback_per_object(tmp_path, monkeypatch):
+    builder = Builder()
+    script = builder.script(CubismRenderer.__fullname__)
+    node = TypeTreeNode.from_list(CubismRenderer.__typetree__)
+    data = encode(node, {**default(node), "m_Script": ptr(script)})
+    # Trailing data the compiled reader refuses, and read_typetree (with check_read=False) doesn't mind
+    broken = builder.add(114, data + bytes(8), script=script)
+    good = builder.add(114, data, script=script)
+    builder.save(str(tmp_path / "renderers"))
+    objects = UnityPy.load(str(tmp_path / "renderers")).objects
+    readers = {obj.path_id: obj for obj in objects}
+
+    assert (
+        UTTCGen_AsInstance(CubismRenderer, readers[broken]).m_Script.m_PathID == script
+    )
+    assert UTTCG_Readers[CubismRenderer.__fullname__, "<", False] is not None
+
+    def read_typetree(*args, **kwargs):
+        raise AssertionError("read with read_typetree")
+
+    monkeypatch.setattr(ObjectReader, "read_typetree", read_typetree)
+    assert UTTCGen_AsInstance(CubismRenderer, readers[good]).m_Script.m_PathID == script
+
+
+@pytest.mark.parametrize("fullname", sorted(chain(*UTTCG_Index.values())))
+def test_same_as_read_typetree(fullname, monkeypatch):
+    """Compiled readers build what read_typetree and the original reflective constructor do"""
+    clazz = UTTCGen_GetClass(fullname)
+    node = UTTCGen_Node(clazz)
+    try:
+        readers = {e: UTTCGen_CompileReader(clazz, e, node, dicts=True) for e in "<>"}
+    except NotImplementedError:
+        pytest.skip("no compiled reader")
+    # Through read_typetree, constructed the way UTTCGen did before constructors were compiled
+    for c in list(UTTCG_Classes.values()):
+        monkeypatch.setattr(c, "__init__", reflective_init(c))
+    rng = random.Random(fullname)
+    for endian, read in readers.items():
+        for _ in range(5):
+            writer = EndianBinaryWriter(endian=endian)
+            TypeTreeHelper.write_typetree(sample(node, 3, rng), node, writer)
+            data = writer.bytes
+            try:
+                expected = reference(clazz, node, data, endian)
+            except TypeError as e:
+                # Annotations that don't fit the typetree (e.g. List[str] for an int) break both the same way
+                with pytest.raises(type(e)):
+                    read(data, None)
+                continue
+            same(read(data, None), expected, fullname)
+
+
+@pytest.mark.parametrize("length", [UTTCG_NUMPY_MIN_LENGTH - 1, UTTCG_NUMPY_MIN_LENGTH])
+def test_numpy_arrays_min_length(length):
+    np = pytest.importorskip("numpy")
+    node = UTTCGen_Node(CubismMoc)
+    writer = EndianBinaryWriter(endian="<")
+    fields = {**sample(node, 0, random.Random()), "_bytes": list(range(length))}
+    TypeTreeHelper.write_typetree(fields, node, writer)
+    read = UTTCGen_CompileReader(CubismMoc, "<", node, numpy=True)
+    moc = read(writer.bytes, None)
+    kind = np.ndarray if length >= UTTCG_NUMPY_MIN_LENGTH else list
+    assert type(moc._bytes) is kind and list(moc._bytes) == list(range(length))